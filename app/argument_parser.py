@@ -6,87 +6,123 @@ application, providing a user-friendly interface for configuring analysis parame
 """
 
 import argparse
+import functools
 import logging
+import sys
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
 
 from app.config import config
-from app.services.cache_service import CacheService
+from app.sensitivity import SENSITIVITY_VARIABLE_ALIASES
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# Accepted spellings for boolean command line values
+_TRUTHY = frozenset({"true", "1", "yes", "on", "y", "t"})
 
-def create_argument_parser() -> argparse.Namespace:
+
+def _str2bool(value: str) -> bool:
+    """Convert a command line string to a boolean."""
+    return value.lower() in _TRUTHY
+
+
+# Subcommands; invocations without one run the analysis
+ANALYZE_COMMAND = "analyze"
+CACHE_INFO_COMMAND = "cache-info"
+CLEAR_CACHE_COMMAND = "clear-cache"
+_COMMANDS = frozenset({ANALYZE_COMMAND, CACHE_INFO_COMMAND, CLEAR_CACHE_COMMAND})
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> Tuple[argparse.ArgumentParser, Mapping[str, argparse.ArgumentParser]]:
     """
-    Create and configure the argument parser.
+    Build the configured argument parser.
+
+    The parser is built once per process and reused on subsequent calls.
 
     Returns:
-        Parsed command line arguments
+        Configured argument parser and its subcommand parsers by command name
     """
     parser = argparse.ArgumentParser(
         description="Financial forecasting application using DCF modeling"
     )
+    subparsers = parser.add_subparsers(dest="command")
+    analyze = subparsers.add_parser(
+        ANALYZE_COMMAND,
+        help="Run DCF analysis (default)",
+        description="Run DCF analysis. This is the default when no command is given.",
+        epilog=(
+            "other commands:\n"
+            f"  {CACHE_INFO_COMMAND:<14}Show cache information and exit\n"
+            f"  {CLEAR_CACHE_COMMAND:<14}Clear all cached data and exit"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
 
     # Core parameters
-    parser.add_argument(
+    analyze.add_argument(
         "--period",
         help="Years to forecast",
         type=int,
         default=config.dcf.default_forecast_years,
     )
-    parser.add_argument(
+    analyze.add_argument(
         "--ticker", help="Single ticker to do historical DCF", type=str, default="AAPL"
     )
-    parser.add_argument(
+    analyze.add_argument(
         "--years",
         help="Number of years to compute DCF analysis for",
         type=int,
         default=config.dcf.default_years,
     )
-    parser.add_argument(
+    analyze.add_argument(
         "--interval",
         help='Interval period for each calc, either "annual" or "quarter"',
+        choices=("annual", "quarter"),
         default=config.dcf.default_interval,
     )
 
     # Sensitivity analysis parameters
-    parser.add_argument(
+    analyze.add_argument(
         "--step_increase",
         help="Step increase for sensitivity analysis",
         type=float,
         default=0,
     )
-    parser.add_argument(
+    analyze.add_argument(
         "--steps",
         help="Steps to take if --step_increase is > 0",
         type=int,
         default=config.dcf.default_steps,
     )
-    parser.add_argument(
+    analyze.add_argument(
         "--variable",
-        help="Variable to increase for sensitivity analysis: [earnings_growth_rate, discount_rate]",
+        help="Variable to increase for sensitivity analysis",
+        choices=list(SENSITIVITY_VARIABLE_ALIASES),
         default=None,
     )
 
     # DCF model parameters
-    parser.add_argument(
+    analyze.add_argument(
         "--discount_rate",
         help="Discount rate for future cash flow to firm",
         type=float,
         default=config.dcf.default_discount_rate,
     )
-    parser.add_argument(
+    analyze.add_argument(
         "--earnings_growth_rate",
         help="Growth in revenue, YoY",
         type=float,
         default=config.dcf.default_earnings_growth_rate,
     )
-    parser.add_argument(
+    analyze.add_argument(
         "--cap_ex_growth_rate",
         help="Growth in cap_ex, YoY",
         type=float,
         default=config.dcf.default_cap_ex_growth_rate,
     )
-    parser.add_argument(
+    analyze.add_argument(
         "--perpetual_growth_rate",
         help="For perpetuity growth terminal value",
         type=float,
@@ -94,57 +130,120 @@ def create_argument_parser() -> argparse.Namespace:
     )
 
     # API configuration
-    parser.add_argument(
-        "--apikey", help="API key for financialmodelingprep.com", default=config.api.api_key
+    analyze.add_argument(
+        "--apikey",
+        help="API key for financialmodelingprep.com (defaults to $APIKEY)",
+        default=None,
     )
 
     # Cache management
-    parser.add_argument(
+    analyze.add_argument(
         "--caching",
         help="Enable caching (use cache if available, fall back to API)",
-        type=lambda x: x.lower() in ("true", "1", "yes", "on"),
+        type=_str2bool,
         default=True,
     )
-    parser.add_argument(
+    analyze.add_argument(
         "--no-caching",
         help="Disable caching (always fetch fresh data from API)",
         action="store_true",
         default=False,
     )
-    parser.add_argument(
+    analyze.add_argument(
         "--clear-cache", help="Clear all cached data before running analysis", action="store_true"
     )
-    parser.add_argument("--cache-info", help="Show cache information and exit", action="store_true")
+    analyze.add_argument(
+        "--cache-info", help="Show cache information and exit", action="store_true"
+    )
+
+    # Cache-only commands take no analysis parameters
+    cache_info = subparsers.add_parser(CACHE_INFO_COMMAND, help="Show cache information and exit")
+    clear_cache = subparsers.add_parser(CLEAR_CACHE_COMMAND, help="Clear all cached data and exit")
+
+    return parser, MappingProxyType(
+        {ANALYZE_COMMAND: analyze, CACHE_INFO_COMMAND: cache_info, CLEAR_CACHE_COMMAND: clear_cache}
+    )
+
+
+def create_argument_parser(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments using the shared parser.
+
+    Arguments that do not start with a subcommand are treated as ``analyze``
+    arguments, so existing invocations keep working. This includes a bare
+    ``--help``, which lists the analysis options along with the cache commands.
 
-    # Parse arguments
-    args = parser.parse_args()
+    Args:
+        argv: Arguments to parse (defaults to ``sys.argv[1:]``)
+
+    Returns:
+        Parsed command line arguments
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] not in _COMMANDS:
+        argv.insert(0, ANALYZE_COMMAND)
+
+    parser, command_parsers = _build_parser()
+    args, unknown = parser.parse_known_args(argv)
+    if unknown:
+        # Report against the subcommand so the usage shown lists its options
+        command_parsers[args.command].error(f"unrecognized arguments: {' '.join(unknown)}")
+
+    # Only analyses need a key; $APIKEY was read into config.api when app.config was imported
+    if args.command == ANALYZE_COMMAND and args.apikey is None:
+        args.apikey = config.api.api_key
 
     return args
 
 
 def show_cache_info() -> None:
     """Display cache information."""
-    cache_service = CacheService()
-    info = cache_service.get_cache_info()
-
-    logger.info("Cache Information:")
-    logger.info(f"Directory: {info['cache_directory']}")
-    logger.info(f"Total files: {info['total_files']}")
-    logger.info(f"Total size: {info['total_size_mb']} MB")
-    logger.info("")
-
-    if info["files"]:
-        logger.info("Cached files:")
-        for file_info in info["files"]:
-            if "error" in file_info:
-                logger.warning(f"  {file_info['file']}: {file_info['error']}")
-            else:
-                status = "✓" if file_info["is_valid"] else "✗"
-                logger.info(
-                    f"  {status} {file_info['file']} "
-                    f"({file_info['ticker']} - {file_info['data_type']})"
-                )
-                logger.info(f"    Cached: {file_info['cached_at']}")
-                logger.info(f"    Size: {file_info['size_bytes']} bytes")
-    else:
+    # Corrupted files are reported as warnings even when INFO output is off
+    if not logger.isEnabledFor(logging.WARNING):
+        return
+
+    from app.services.cache_service import get_cache_service
+
+    cache_service = get_cache_service()
+    logger.info(f"Cache Information:\nDirectory: {cache_service.cache_directory}\n")
+
+    # Stream one record per file; totals are reported once the scan is done
+    total_files = 0
+    total_size = 0
+    for file_info in cache_service.iter_cache_info():
+        if total_files == 0:
+            logger.info("Cached files:")
+        total_files += 1
+        total_size += file_info["size_bytes"]
+        if "error" in file_info:
+            logger.warning(_format_cache_file_info(file_info))
+        else:
+            logger.info(_format_cache_file_info(file_info))
+
+    if total_files == 0:
         logger.info("No cached files found.")
+
+    logger.info(
+        f"Total files: {total_files}\nTotal size: {round(total_size / (1024 * 1024), 2)} MB"
+    )
+
+
+def _format_cache_file_info(file_info: dict) -> str:
+    """
+    Format a single cache file entry for display.
+
+    Args:
+        file_info: Dictionary describing one cache file
+
+    Returns:
+        Formatted multi-line description
+    """
+    if "error" in file_info:
+        return f"  {file_info['file']}: {file_info['error']}"
+
+    status = "✓" if file_info["is_valid"] else "✗"
+    return (
+        f"  {status} {file_info['file']} ({file_info['ticker']} - {file_info['data_type']})\n"
+        f"    Cached: {file_info['cached_at']}\n"
+        f"    Size: {file_info['size_bytes']} bytes"
+    )
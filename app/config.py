@@ -3,23 +3,27 @@ Configuration settings for the financial forecasting application.
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class APIConfig:
     """API configuration settings."""
 
     base_url: str = "https://financialmodelingprep.com/api/v3"
-    api_key: Optional[str] = None
-
-    def __post_init__(self) -> None:
-        if self.api_key is None:
-            self.api_key = os.environ.get("APIKEY")
-
-
-@dataclass
+    api_key: Optional[str] = field(default_factory=lambda: os.environ.get("APIKEY"))
+    connect_timeout: float = 3.05
+    read_timeout: float = 10.0
+    max_retries: int = 3
+    retry_backoff_factor: float = 0.3
+    pool_connections: int = 16
+    pool_maxsize: int = 32
+    max_workers: int = 16
+    historical_max_range_days: int = 1825
+
+
+@dataclass(frozen=True, slots=True)
 class DCFConfig:
     """DCF model configuration settings."""
 
@@ -33,7 +37,7 @@ class DCFConfig:
     default_steps: int = 5
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VisualizationConfig:
     """Visualization configuration settings."""
 
@@ -44,21 +48,13 @@ class VisualizationConfig:
     color_palette: str = "husl"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Main application configuration."""
 
-    api: APIConfig = None
-    dcf: DCFConfig = None
-    visualization: VisualizationConfig = None
-
-    def __post_init__(self) -> None:
-        if self.api is None:
-            self.api = APIConfig()
-        if self.dcf is None:
-            self.dcf = DCFConfig()
-        if self.visualization is None:
-            self.visualization = VisualizationConfig()
+    api: APIConfig = field(default_factory=APIConfig)
+    dcf: DCFConfig = field(default_factory=DCFConfig)
+    visualization: VisualizationConfig = field(default_factory=VisualizationConfig)
 
 
 # Global configuration instance
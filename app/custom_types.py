@@ -2,23 +2,25 @@
 Custom type definitions for the financial forecasting application.
 """
 
+import logging
+import math
+import sys
 from dataclasses import dataclass
-from enum import Enum
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from typing_extensions import TypedDict
 
+from app.exceptions import DCFCalculationError
 
-class SensitivityVariable(Enum):
-    """Enum for sensitivity analysis variables."""
+# Re-exported for existing imports; defined in a numpy-free module for the CLI
+from app.sensitivity import SENSITIVITY_VARIABLE_ALIASES, SensitivityVariable  # noqa: F401
 
-    EARNINGS_GROWTH_RATE = "earnings_growth_rate"
-    DISCOUNT_RATE = "discount_rate"
-    CAP_EX_GROWTH_RATE = "cap_ex_growth_rate"
-    PERPETUAL_GROWTH_RATE = "perpetual_growth_rate"
+# Configure logging for this module
+logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DCFParameters:
     """Parameters for DCF calculation."""
 
@@ -32,8 +34,15 @@ class DCFParameters:
     interval: str
     api_key: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # Shared across every sensitivity step and historical period
+        object.__setattr__(self, "ticker", sys.intern(self.ticker))
+        object.__setattr__(self, "interval", sys.intern(self.interval))
+        if self.api_key is not None:
+            object.__setattr__(self, "api_key", sys.intern(self.api_key))
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DCFResult:
     """Result of a single DCF calculation."""
 
@@ -42,47 +51,126 @@ class DCFResult:
     equity_value: float
     share_price: float
 
+    def __post_init__(self) -> None:
+        # The same period dates repeat across every sensitivity step
+        object.__setattr__(self, "date", sys.intern(self.date))
+
 
 DCFResults = Dict[str, DCFResult]
 
 
+@dataclass(slots=True)
+class DCFResultsFrame:
+    """Column-oriented view of DCF results, one array per result field."""
+
+    labels: List[str]
+    dates: np.ndarray
+    enterprise_value: np.ndarray
+    equity_value: np.ndarray
+    share_price: np.ndarray
+
+    @classmethod
+    def from_results(cls, results: DCFResults) -> "DCFResultsFrame":
+        """Build the frame from a ``{label: DCFResult}`` mapping in one pass."""
+        count = len(results)
+        values = list(results.values())
+        return cls(
+            labels=list(results),
+            dates=np.array([result.date for result in values], dtype="datetime64[D]"),
+            enterprise_value=np.fromiter(
+                (result.enterprise_value for result in values), dtype=np.float64, count=count
+            ),
+            equity_value=np.fromiter(
+                (result.equity_value for result in values), dtype=np.float64, count=count
+            ),
+            share_price=np.fromiter(
+                (result.share_price for result in values), dtype=np.float64, count=count
+            ),
+        )
+
+
 class APIResponse(TypedDict):
     """Response from financial API."""
 
 
-class IncomeStatement(TypedDict):
-    """Income statement data."""
+class FinancialStatement(TypedDict):
+    """Common shape of every financial statement returned by the data fetcher."""
 
     ticker: str
     period: str
     data: List[Dict[str, Any]]
 
 
-class BalanceStatement(TypedDict):
-    """Balance sheet data."""
+class IncomeStatement(FinancialStatement):
+    """Income statement data."""
 
-    ticker: str
-    period: str
-    data: List[Dict[str, Any]]
+
+class BalanceStatement(FinancialStatement):
+    """Balance sheet data."""
 
 
-class CashFlowStatement(TypedDict):
+class CashFlowStatement(FinancialStatement):
     """Cash flow statement data."""
 
-    ticker: str
-    period: str
-    data: List[Dict[str, Any]]
-
 
-class EnterpriseValueStatement(TypedDict):
+class EnterpriseValueStatement(FinancialStatement):
     """Enterprise value statement data."""
 
-    ticker: str
-    period: str
-    data: List[Dict[str, Any]]
 
+@dataclass(slots=True)
+class StatementFrame:
+    """
+    Column-oriented view of a financial statement.
+
+    Each numeric field is stored as one float64 array indexed by period (most
+    recent first), so DCF math reads ``columns[field][i]`` instead of probing a
+    dict per row.
+    """
 
-@dataclass
+    ticker: str
+    period: str
+    dates: List[str]
+    columns: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def value(self, field: str, index: int = 0, default: Optional[float] = None) -> float:
+        """
+        Return ``field`` for period ``index``.
+
+        Args:
+            field: Statement field name
+            index: Period index (0 is the most recent)
+            default: Value for an optional field that is missing or not a number;
+                None makes the field required
+
+        Returns:
+            The field's value
+
+        Raises:
+            DCFCalculationError: If a required field is missing or not a number
+        """
+        column = self.columns.get(field)
+        value = float(column[index]) if column is not None and index < len(column) else None
+        if value is not None and not math.isnan(value):
+            return value
+
+        date = self.dates[index] if index < len(self.dates) else f"period {index}"
+        if default is None:
+            problem = "missing" if value is None else "empty or not a number"
+            raise DCFCalculationError(
+                f"Required field '{field}' is {problem} in {self.ticker} statement for {date}"
+            )
+        if value is not None:
+            logger.warning(
+                f"Field '{field}' is empty or not a number in {self.ticker} statement for {date}; "
+                f"using {default}"
+            )
+        return default
+
+
+@dataclass(slots=True)
 class VisualizationData:
     """Data for visualization generation."""
 
@@ -6,26 +6,40 @@ Custom exceptions for the financial forecasting application.
 class FinancialForecastingError(Exception):
     """Base exception for financial forecasting application."""
 
+    __slots__ = ()
+
 
 class APIError(FinancialForecastingError):
     """Raised when there's an error with API calls."""
 
+    __slots__ = ()
+
 
 class DataFetchError(APIError):
     """Raised when financial data cannot be fetched."""
 
+    __slots__ = ()
+
 
 class InvalidParameterError(FinancialForecastingError):
     """Raised when invalid parameters are provided."""
 
+    __slots__ = ()
+
 
 class DCFCalculationError(FinancialForecastingError):
     """Raised when DCF calculation fails."""
 
+    __slots__ = ()
+
 
 class VisualizationError(FinancialForecastingError):
     """Raised when visualization generation fails."""
 
+    __slots__ = ()
+
 
 class ConfigurationError(FinancialForecastingError):
     """Raised when there's a configuration issue."""
+
+    __slots__ = ()
@@ -22,6 +22,13 @@ Key Optional Parameters:
 - **--discount_rate**: Discount rate for future cash flows (default: 0.1)
 - **--earnings_growth_rate**: Assumed earnings growth rate (default: 0.05)
 
+Cache Commands:
+---------------
+- **cache-info**: Show cached files and exit
+- **clear-cache**: Remove all cached files and exit
+
+Arguments given without a command run the analysis (same as ``analyze``).
+
 Output:
 --------
 - Terminal output with key valuation metrics
@@ -33,47 +40,85 @@ Data Sources:
 - Financial statements from Financial Modeling Prep API
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 
-from app.argument_parser import create_argument_parser, show_cache_info
-from app.services.application_service import ApplicationService
-from app.services.cache_service import CacheService
-from app.services.validation_service import ValidationService
+from app.argument_parser import (
+    CACHE_INFO_COMMAND,
+    CLEAR_CACHE_COMMAND,
+    create_argument_parser,
+    show_cache_info,
+)
 
 # Configure logging for the main application
 logger = logging.getLogger(__name__)
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def _configure_logging() -> None:
+    """
+    Attach the application log handler unless the root logger is already set up.
+
+    Records are handed to a queue and written to stderr by a background
+    listener, so logging calls (e.g. from ErrorHandler) don't block on I/O.
+    The listener is stopped at exit, flushing any queued records.
+    """
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+
+    handler = logging.StreamHandler()
+    # The format string is a fixed constant, so skip re-validating it
+    handler.setFormatter(logging.Formatter(LOG_FORMAT, validate=False))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.INFO)
+
 
 def main() -> None:
     """Main entry point for the application."""
     # Configure basic logging for the application
-    logging.basicConfig(
-        level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    _configure_logging()
 
     args = create_argument_parser()
 
     # Handle cache management commands
-    if args.cache_info:
+    if args.command == CACHE_INFO_COMMAND or getattr(args, "cache_info", False):
         show_cache_info()
         return
 
     # Handle cache clearing
-    if args.clear_cache:
+    if args.command == CLEAR_CACHE_COMMAND or getattr(args, "clear_cache", False):
+        from app.services.cache_service import get_cache_service
+
         logger.info("Clearing cache...")
-        cache_service = CacheService()
-        cache_service.clear_cache()
+        get_cache_service().clear_cache()
         logger.info("Cache cleared.")
+        if args.command == CLEAR_CACHE_COMMAND:
+            return
+
+    # Service imports are deferred so that cache-only commands do not pay for
+    # loading the analysis and plotting stack
+    from app.services.application_service import ApplicationService
+    from app.services.validation_service import get_validation_service
 
     # Create services
-    validation_service = ValidationService()
+    validation_service = get_validation_service()
 
     # Validate all parameters early (fail fast principle)
     validation_service.validate_all_parameters(args)
 
     # Run application
     app = ApplicationService(args)
-    app.run(validation_service, args)
+    app.run(validation_service)
 
 
 if __name__ == "__main__":
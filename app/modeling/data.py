@@ -4,11 +4,29 @@ Financial data fetching utilities using financialmodelingprep.com API.
 NOTE: Some code taken directly from their documentation. See: https://financialmodelingprep.com/developer/docs/.
 """
 
-import json
+import asyncio
+import atexit
+import copy
+import datetime
+import functools
 import logging
-import traceback
-from typing import Dict, List, Optional
-from urllib.request import URLError, urlopen
+import math
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from http import HTTPStatus
+from types import MappingProxyType, TracebackType
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import quote, urlencode
+
+import numpy as np
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 from app.config import config
 from app.custom_types import (
@@ -16,43 +34,297 @@ from app.custom_types import (
     BalanceStatement,
     CashFlowStatement,
     EnterpriseValueStatement,
+    FinancialStatement,
     IncomeStatement,
+    StatementFrame,
 )
-from app.exceptions import APIError, DataFetchError, InvalidParameterError
-from app.services.cache_service import CacheService
+from app.exceptions import APIError, ConfigurationError, DataFetchError, InvalidParameterError
+from app.services.cache_service import get_cache_service
+
+try:
+    import httpx
+except ImportError:  # Optional dependency, only needed for the async batch methods
+    httpx = None
+
+try:
+    import ijson
+except ImportError:  # Optional dependency, statements are parsed in one piece without it
+    ijson = None
+
+try:
+    import orjson as _json
+except ImportError:  # Optional dependency, stdlib json is the slower fallback
+    import json as _json
+
+try:
+    import simdjson
+except ImportError:  # Optional dependency, responses are parsed with _json instead
+    simdjson = None
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# simdjson parsers reuse their buffers between documents but aren't thread-safe,
+# so each worker thread keeps its own
+_parsers = threading.local()
+
+# Price endpoints; cached alongside the statements under these data types
+REAL_TIME_PRICE = "stock/real-time-price"
+HISTORICAL_PRICE = "historical-price-full"
+
+VALID_PERIODS = frozenset({"annual", "quarter"})
+
+# Tickers per request on the comma-joined real-time price endpoint
+BATCH_PRICE_MAX_TICKERS = 100
+
+# Statement endpoints whose responses wrap their rows in a "financials" list
+FINANCIAL_STATEMENT_TYPES = frozenset(
+    {
+        "financials/income-statement",
+        "financials/cash-flow-statement",
+        "financials/balance-sheet-statement",
+    }
+)
+
+_RATE_LIMIT_NOTE = re.compile("limit", re.IGNORECASE)
+
+# Bounds for the per-fetcher in-memory copy of cache hits; entries never
+# outlive their data type's disk TTL either
+MEMORY_CACHE_MAXSIZE = 256
+MEMORY_CACHE_TTL_SECONDS = 3600
+
+# Bodies the API sends when it has nothing for a ticker; recognised before parsing
+_EMPTY_BODIES = frozenset({b"", b"null", b"[]", b"{}"})
+_EMPTY_BODY_MAX_LENGTH = 16
+
+# Response headers stored with cache entries for conditional revalidation
+CACHE_VALIDATOR_HEADERS = MappingProxyType({"etag": "ETag", "last_modified": "Last-Modified"})
+
+# A date's close is the latest trading day within this many days before it
+HISTORICAL_WINDOW_DAYS = 2
+
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session with keep-alive connection pooling and retries.
+
+    Returns:
+        Session whose HTTPS adapter reuses connections to the API host
+    """
+    retry = Retry(
+        total=config.api.max_retries,
+        backoff_factor=config.api.retry_backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=config.api.pool_connections,
+        pool_maxsize=config.api.pool_maxsize,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # Ask for every encoding urllib3 can decode here (gzip/deflate, plus br and
+    # zstd when brotli/zstandard are installed); JSON compresses very well
+    session.headers.update(
+        {"Accept-Encoding": ACCEPT_ENCODING, "User-Agent": "financial-forecasting/0.1.0"}
+    )
+    return session
+
+
+def _historical_window_start(date: str) -> str:
+    """
+    Get the first day of the lookup window for a historical close.
+
+    Args:
+        date: Date (YYYY-MM-DD) whose close price is wanted
+
+    Returns:
+        ISO date ``HISTORICAL_WINDOW_DAYS`` calendar days earlier
+
+    Raises:
+        ValueError: If ``date`` is not an ISO date
+    """
+    start = datetime.date.fromisoformat(date) - datetime.timedelta(days=HISTORICAL_WINDOW_DAYS)
+    return start.isoformat()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_shared_session() -> requests.Session:
+    """Session shared by the legacy module-level helpers."""
+    return create_session()
+
+
+# Fetchers of the legacy module-level helpers by API key; they stay open for the
+# life of the process and are closed at exit so queued cache writes are flushed
+_legacy_fetchers: Dict[str, "FinancialDataFetcher"] = {}
+_legacy_fetchers_lock = threading.Lock()
+
+
+def _fetcher_for(apikey: str) -> "FinancialDataFetcher":
+    """Fetcher reused by the legacy helpers for an API key (the configured key if empty)."""
+    apikey = apikey or config.api.api_key or ""
+    with _legacy_fetchers_lock:
+        fetcher = _legacy_fetchers.get(apikey)
+        if fetcher is None:
+            fetcher = FinancialDataFetcher(apikey, session=_get_shared_session())
+            _legacy_fetchers[apikey] = fetcher
+    return fetcher
+
+
+@atexit.register
+def _close_legacy_fetchers() -> None:
+    """Close the legacy helpers' fetchers and their shared session."""
+    with _legacy_fetchers_lock:
+        fetchers = list(_legacy_fetchers.values())
+        _legacy_fetchers.clear()
+    for fetcher in fetchers:
+        fetcher.close()
+    if _get_shared_session.cache_info().currsize:
+        _get_shared_session().close()
+        _get_shared_session.cache_clear()
+
+
+def _loads_json(raw: bytes) -> APIResponse:
+    """
+    Parse a JSON response body straight from its raw bytes.
+
+    Uses simdjson with a per-thread parser when installed, otherwise orjson or
+    the standard library. Every parser raises a ValueError subclass on bad input.
+    """
+    if simdjson is None:
+        return _json.loads(raw)
+
+    parser = getattr(_parsers, "parser", None)
+    if parser is None:
+        parser = _parsers.parser = simdjson.Parser()
+    # Materialize plain Python objects: responses are validated, cached and
+    # reused after the parser has moved on to the next document
+    return parser.parse(raw, True)
+
 
 class FinancialDataFetcher:
     """Handles fetching financial data from the API with caching."""
 
-    def __init__(self, api_key: Optional[str] = None, caching: bool = True) -> None:
+    __slots__ = (
+        "api_key",
+        "caching",
+        "cache_service",
+        "max_workers",
+        "_owns_session",
+        "_session",
+        "_url_templates",
+        "_historical_url_template",
+        "_fetch_locks",
+        "_fetch_locks_guard",
+        "_memory_cache",
+        "_memory_cache_lock",
+        "_writer",
+    )
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        caching: bool = True,
+        session: Optional[requests.Session] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
         """
         Initialize the data fetcher.
 
         Args:
             api_key: API key for financial data services
             caching: Whether to enable caching (default: True)
+            session: HTTP session to reuse (a new pooled session is created if None)
+            max_workers: Concurrent requests for batch lookups (defaults to config)
         """
         self.api_key = api_key or config.api.api_key
         if not self.api_key:
             raise InvalidParameterError("API key is required")
 
         self.caching = caching
-        self.cache_service = CacheService() if caching else None
+        self.cache_service = get_cache_service() if caching else None
+
+        self._owns_session = session is None
+        self._session = session or create_session()
+        self.max_workers = max_workers or config.api.max_workers
+
+        # URL templates with the base URL and encoded API key bound once per fetcher
+        # (urlencode also escapes any braces in the key, keeping str.format safe)
+        base_url = config.api.base_url
+        apikey_query = urlencode({"apikey": self.api_key})
+        self._url_templates = {
+            "annual": f"{base_url}/{{endpoint}}/{{ticker}}?{apikey_query}",
+            "quarter": f"{base_url}/{{endpoint}}/{{ticker}}?period=quarter&{apikey_query}",
+        }
+        self._historical_url_template = (
+            f"{base_url}/{HISTORICAL_PRICE}/{{ticker}}?from={{start}}&to={{end}}&{apikey_query}"
+        )
+
+        # Serializes cache lookups and fetches per cache key so concurrent callers
+        # asking for the same data wait for the first download instead of
+        # repeating it, while different keys are fetched in parallel. Each lock is
+        # kept with the number of callers using it and dropped when that reaches
+        # zero, so one-off keys such as historical price dates don't accumulate
+        self._fetch_locks: Dict[tuple[str, str, str], tuple[threading.Lock, int]] = {}
+        self._fetch_locks_guard = threading.Lock()
+
+        # Recently used cache entries kept in memory as (expires_at, data) so
+        # repeated lookups skip the file read and JSON decode
+        self._memory_cache: OrderedDict[tuple[str, str, str], tuple[float, APIResponse]] = (
+            OrderedDict()
+        )
+        self._memory_cache_lock = threading.Lock()
+
+        # Cache files are written behind the fetch path on a single thread, so
+        # callers don't wait on disk and writes to the same file stay ordered
+        self._writer = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-writer")
+            if self.cache_service
+            else None
+        )
+
+    def __enter__(self) -> "FinancialDataFetcher":
+        """Enter a context that closes the fetcher's HTTP session on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the HTTP session when leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Flush pending cache writes and release pooled HTTP connections owned by this fetcher."""
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+        if self._owns_session:
+            self._session.close()
 
     def _build_url(self, endpoint: str, ticker: str, period: str = "annual") -> str:
-        """Build API URL for the given endpoint and parameters."""
-        if period not in ["annual", "quarter"]:
+        """
+        Build API URL for the given endpoint and parameters.
+
+        For the historical price endpoint ``period`` is the YYYY-MM-DD date to
+        look up rather than a reporting period. The ticker is percent-encoded as a
+        path segment; commas are kept so batch quotes can join several symbols.
+        """
+        ticker = quote(ticker, safe=",")
+        if endpoint == REAL_TIME_PRICE:
+            return self._url_templates["annual"].format(endpoint=endpoint, ticker=ticker)
+        if endpoint == HISTORICAL_PRICE:
+            return self._historical_url_template.format(
+                ticker=ticker, start=_historical_window_start(period), end=period
+            )
+
+        if period not in VALID_PERIODS:
             raise InvalidParameterError(f"Invalid period: {period}")
 
-        base_url = config.api.base_url
-        if period == "annual":
-            return f"{base_url}/{endpoint}/{ticker}?apikey={self.api_key}"
-        else:
-            return f"{base_url}/{endpoint}/{ticker}?period=quarter&apikey={self.api_key}"
+        return self._url_templates[period].format(endpoint=endpoint, ticker=ticker)
 
     def _validate_financial_data(self, data: APIResponse, data_type: str) -> None:
         """
@@ -72,15 +344,11 @@ class FinancialDataFetcher:
         if isinstance(data, dict):
             if "Error Message" in data:
                 raise APIError(f"API Error for {data_type}: {data['Error Message']}")
-            if "Note" in data and "limit" in data["Note"].lower():
+            if "Note" in data and _RATE_LIMIT_NOTE.search(data["Note"]):
                 raise APIError(f"API rate limit exceeded for {data_type}")
 
         # Validate data structure based on type
-        if data_type in [
-            "financials/income-statement",
-            "financials/cash-flow-statement",
-            "financials/balance-sheet-statement",
-        ]:
+        if data_type in FINANCIAL_STATEMENT_TYPES:
             if "financials" not in data:
                 raise DataFetchError(f"Missing 'financials' key in {data_type} response")
             if not data["financials"]:
@@ -88,97 +356,409 @@ class FinancialDataFetcher:
 
     def _fetch_json_data(self, url: str) -> APIResponse:
         """Fetch and parse JSON data from the given URL."""
+        response = self._get(url)
+        return self._decode_json_response(url, response)
+
+    def _fetch_json_stream(self, url: str) -> APIResponse:
+        """
+        Fetch a JSON object, parsing its members incrementally as the body arrives.
+
+        Used for the large statement responses: ijson reads the top-level members
+        straight off the socket, so the full body is never buffered in memory
+        alongside the parsed objects. Requires the optional ``ijson`` dependency.
+        """
+        with self._get(url, stream=True) as response:
+            return self._decode_json_stream(url, response)
+
+    def _fetch_for_cache(
+        self, url: str, data_type: str, validators: Dict[str, str]
+    ) -> tuple[Optional[APIResponse], Dict[str, str]]:
+        """
+        Fetch data that will be cached, revalidating a stale copy when possible.
+
+        Args:
+            url: URL to fetch
+            data_type: Type of financial data (statements are streamed)
+            validators: 'etag'/'last_modified' values stored with the stale copy
+
+        Returns:
+            Tuple of the parsed data (None if the server answered 304 Not Modified)
+            and the validators to store with it
+        """
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        stream = ijson is not None and data_type in FINANCIAL_STATEMENT_TYPES
+        with self._get(url, stream=stream, headers=headers) as response:
+            if response.status_code == HTTPStatus.NOT_MODIFIED:
+                return None, validators
+
+            if stream:
+                data = self._decode_json_stream(url, response)
+            else:
+                data = self._decode_json_response(url, response)
+
+            response_validators = {
+                key: response.headers[header]
+                for key, header in CACHE_VALIDATOR_HEADERS.items()
+                if response.headers.get(header)
+            }
+            return data, response_validators
+
+    def _decode_json_stream(self, url: str, response: requests.Response) -> APIResponse:
+        """Incrementally decode a streamed response body and check it for API errors."""
+        response.raw.decode_content = True
+        try:
+            json_data = dict(ijson.kvitems(response.raw, "", use_float=True))
+        except ijson.JSONError as e:
+            logger.error(f"JSON decode error for {url}: {e}")
+            raise DataFetchError(f"JSON decode error for {url}: {e}")
+        except (urllib3.exceptions.HTTPError, OSError) as e:
+            logger.error(f"Error reading response from {url}: {e}")
+            raise DataFetchError(f"Error reading response from {url}: {e}") from e
+
+        return self._check_api_error(url, json_data)
+
+    def _get(
+        self, url: str, stream: bool = False, headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        """Issue a GET on the pooled session, mapping transport failures to DataFetchError."""
         try:
             # Validate URL scheme for security
             if not url.startswith(("http://", "https://")):
                 raise DataFetchError(f"Invalid URL scheme: {url}")
-            response = urlopen(url)  # noqa: S310
-        except URLError as e:
+            response = self._session.get(
+                url,
+                timeout=(config.api.connect_timeout, config.api.read_timeout),
+                stream=stream,
+                headers=headers,
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
             error_msg = f"Error retrieving {url}"
-            try:
-                error_msg += f": {e.read().decode()}"
-            except AttributeError:
-                pass
+            if e.response is not None and e.response.text:
+                error_msg += f": {e.response.text}"
             logger.error(error_msg)
             raise DataFetchError(error_msg) from e
 
+        return response
+
+    async def _afetch_json_data(self, client: "httpx.AsyncClient", url: str) -> APIResponse:
+        """Asynchronously fetch and parse JSON data from the given URL."""
         try:
-            data = response.read().decode("utf-8")
-            json_data = json.loads(data)
-        except json.JSONDecodeError as e:
+            if not url.startswith(("http://", "https://")):
+                raise DataFetchError(f"Invalid URL scheme: {url}")
+            response = await client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            error_msg = f"Error retrieving {url}"
+            if isinstance(e, httpx.HTTPStatusError) and e.response.text:
+                error_msg += f": {e.response.text}"
+            logger.error(error_msg)
+            raise DataFetchError(error_msg) from e
+
+        return self._decode_json_response(url, response)
+
+    def _decode_json_response(self, url: str, response: Any) -> APIResponse:  # noqa: ANN401
+        """Decode a requests/httpx response body and check it for API errors."""
+        raw = response.content
+        if len(raw) < _EMPTY_BODY_MAX_LENGTH and raw.strip() in _EMPTY_BODIES:
+            raise DataFetchError(f"Empty response received from {url}")
+
+        try:
+            json_data = _loads_json(raw)
+        except ValueError as e:
             logger.error(f"JSON decode error for {url}: {e}")
             raise DataFetchError(f"JSON decode error for {url}: {e}")
 
-        if "Error Message" in json_data:
+        return self._check_api_error(url, json_data)
+
+    def _check_api_error(self, url: str, json_data: APIResponse) -> APIResponse:
+        """Raise APIError if the decoded response is an API error message."""
+        # Errors always come back as an object; a membership test on a list
+        # response would compare against every element instead
+        if isinstance(json_data, dict) and "Error Message" in json_data:
             raise APIError(f"API Error for '{url}': {json_data['Error Message']}")
 
         return json_data
 
+    def _async_client(self) -> "httpx.AsyncClient":
+        """
+        Create an HTTP/2 client that multiplexes a batch over one connection.
+
+        Returns:
+            Configured httpx.AsyncClient
+
+        Raises:
+            ConfigurationError: If the optional httpx dependency is not installed
+        """
+        if httpx is None:
+            raise ConfigurationError(
+                "Async fetching requires httpx; install financial_forecasting[async]"
+            )
+
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=config.api.max_retries,
+            limits=httpx.Limits(
+                max_connections=config.api.pool_maxsize,
+                max_keepalive_connections=config.api.pool_maxsize,
+            ),
+        )
+        return httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(config.api.read_timeout, connect=config.api.connect_timeout),
+        )
+
     def _get_cached_or_fetch(
-        self, ticker: str, data_type: str, period: str = "annual"
+        self, ticker: str, data_type: str, period: str = "annual", force_refresh: bool = False
     ) -> APIResponse:
         """
         Get data from cache if available, otherwise fetch from API.
 
+        If the API can't be reached or answers with an error, an expired cache
+        entry is served instead of failing.
+
         Args:
             ticker: Company ticker symbol
             data_type: Type of financial data
-            period: Data period ('annual' or 'quarter')
+            period: Data period ('annual' or 'quarter', or the date for historical prices)
+            force_refresh: Fetch from the API even if the cached data is still fresh
 
         Returns:
             Financial data from cache or API
+
+        Raises:
+            APIError: If the API request fails and nothing is cached
         """
-        if self.caching and self.cache_service:
-            # Try to load from cache first
-            cached_data = self.cache_service.load_data(ticker, data_type, period)
+        key = (ticker, data_type, period)
+        with self._fetch_locks_guard:
+            lock, users = self._fetch_locks.get(key, (None, 0))
+            if lock is None:
+                lock = threading.Lock()
+            self._fetch_locks[key] = (lock, users + 1)
+        try:
+            with lock:
+                return self._load_or_fetch(ticker, data_type, period, force_refresh)
+        finally:
+            with self._fetch_locks_guard:
+                _, users = self._fetch_locks[key]
+                if users == 1:
+                    del self._fetch_locks[key]
+                else:
+                    self._fetch_locks[key] = (lock, users - 1)
+
+    def _load_or_fetch(
+        self, ticker: str, data_type: str, period: str, force_refresh: bool = False
+    ) -> APIResponse:
+        """Cache-then-API lookup; callers must hold the fetch lock for this key."""
+        # Try to load from cache first
+        if not force_refresh:
+            cached_data = self._load_cached(ticker, data_type, period)
             if cached_data is not None:
                 logger.info(f"Using cached data for {ticker} {data_type}")
                 return cached_data
 
+        # An expired entry can still be revalidated instead of downloaded again
+        stale_entry = None
+        if self.caching and self.cache_service:
+            stale_entry = self.cache_service.load_entry(ticker, data_type, period)
+        validators = (
+            {key: stale_entry[key] for key in CACHE_VALIDATOR_HEADERS if stale_entry.get(key)}
+            if stale_entry
+            else {}
+        )
+
         # Fetch from API (caching disabled doesn't prevent API calls)
         url = self._build_url(data_type, ticker, period)
-        data = self._fetch_json_data(url)
-
-        # Validate the fetched data
-        self._validate_financial_data(data, data_type)
+        try:
+            data, validators = self._fetch_for_cache(url, data_type, validators)
+            if data is not None:
+                self._validate_financial_data(data, data_type)
+        except APIError as e:
+            if not stale_entry or "data" not in stale_entry:
+                raise
+            # Expired data beats no data; it isn't refreshed so the next call retries
+            logger.warning(f"Serving expired cache for {ticker} {data_type} after API error: {e}")
+            return stale_entry["data"]
+
+        if data is None:
+            logger.info(f"Cached data for {ticker} {data_type} is still current")
+            data = stale_entry["data"]
+            self._remember((ticker, data_type, period), data)
+            # The writer thread gets its own copy; the caller may modify the data
+            self._write_behind(
+                f"refresh cache for {ticker} {data_type}",
+                self.cache_service.refresh_entry,
+                ticker,
+                data_type,
+                copy.deepcopy(stale_entry),
+                period,
+            )
+            return data
 
         # Save to cache if caching is enabled
         if self.caching and self.cache_service:
-            try:
-                self.cache_service.save_data(ticker, data_type, data, period)
-                logger.info(f"Cached data for {ticker} {data_type}")
-            except (OSError, IOError, ValueError, TypeError) as e:
-                logger.warning(f"Failed to cache data for {ticker}: {e}")
+            self._store_cached(ticker, data_type, period, data, validators)
+
+        return data
 
+    def _load_cached(self, ticker: str, data_type: str, period: str) -> Optional[APIResponse]:
+        """
+        Look cached data up in memory first, then in the cache service.
+
+        Args:
+            ticker: Company ticker symbol
+            data_type: Type of financial data
+            period: Data period (or date for historical prices)
+
+        Returns:
+            Cached data, or None when caching is disabled or nothing valid is cached.
+            The data is a copy the caller may modify.
+        """
+        if not (self.caching and self.cache_service):
+            return None
+
+        key = (ticker, data_type, period)
+        data = None
+        with self._memory_cache_lock:
+            entry = self._memory_cache.get(key)
+            if entry is not None:
+                expires_at, data = entry
+                if expires_at > time.monotonic():
+                    self._memory_cache.move_to_end(key)
+                else:
+                    del self._memory_cache[key]
+                    data = None
+        if data is not None:
+            return copy.deepcopy(data)
+
+        loaded = self.cache_service.load_data_with_expiry(ticker, data_type, period)
+        if loaded is None:
+            return None
+        data, expires_at = loaded
+        self._remember(key, data, expires_at)
         return data
 
+    def _store_cached(
+        self,
+        ticker: str,
+        data_type: str,
+        period: str,
+        data: APIResponse,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Keep freshly fetched data in memory and queue its write to the cache service."""
+        self._remember((ticker, data_type, period), data)
+        # The writer thread gets its own copy; the caller may modify the data
+        self._write_behind(
+            f"cache data for {ticker} {data_type}",
+            self.cache_service.save_data,
+            ticker,
+            data_type,
+            copy.deepcopy(data),
+            period,
+            validators,
+        )
+
+    def _write_behind(self, description: str, write: Callable[..., None], *args: object) -> None:
+        """
+        Run a cache write on the writer thread, logging its outcome when it completes.
+
+        Args:
+            description: What the write does, used in log messages
+            write: Cache service method performing the write
+            *args: Arguments passed to the write
+        """
+
+        def log_outcome(future: Future) -> None:
+            error = future.exception()
+            if error is None:
+                logger.info(f"Finished: {description}")
+            else:
+                logger.warning(f"Failed to {description}: {error}")
+
+        try:
+            future = self._writer.submit(write, *args)
+        except RuntimeError:
+            # The writer was shut down by close(); nothing more is persisted
+            logger.debug(f"Cache writer closed, skipping: {description}")
+            return
+        future.add_done_callback(log_outcome)
+
+    def _remember(
+        self, key: tuple[str, str, str], data: APIResponse, expires_at: Optional[float] = None
+    ) -> None:
+        """
+        Insert a copy into the in-memory cache, evicting the least recently used entries.
+
+        The cache keeps its own copy so callers can modify the data they were handed.
+
+        Args:
+            key: (ticker, data type, period) cache key
+            data: Data to keep
+            expires_at: When the cached entry expires (seconds since the epoch);
+                defaults to a full TTL for data that was just fetched
+        """
+        remaining = self.cache_service.get_ttl_seconds(key[1])
+        if expires_at is not None:
+            remaining = min(remaining, expires_at - time.time())
+        ttl = min(remaining, MEMORY_CACHE_TTL_SECONDS)
+        data = copy.deepcopy(data)
+        with self._memory_cache_lock:
+            self._memory_cache[key] = (time.monotonic() + ttl, data)
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > MEMORY_CACHE_MAXSIZE:
+                self._memory_cache.popitem(last=False)
+
     def get_enterprise_value_statement(
-        self, ticker: str, period: str = "annual"
+        self, ticker: str, period: str = "annual", force_refresh: bool = False
     ) -> EnterpriseValueStatement:
         """Fetch enterprise value statement."""
-        data = self._get_cached_or_fetch(ticker, "enterprise-value", period)
+        data = self._get_cached_or_fetch(ticker, "enterprise-value", period, force_refresh)
         return EnterpriseValueStatement(ticker=ticker, period=period, data=data)
 
-    def get_income_statement(self, ticker: str, period: str = "annual") -> IncomeStatement:
+    def get_income_statement(
+        self, ticker: str, period: str = "annual", force_refresh: bool = False
+    ) -> IncomeStatement:
         """Fetch income statement."""
-        data = self._get_cached_or_fetch(ticker, "financials/income-statement", period)
+        data = self._get_cached_or_fetch(
+            ticker, "financials/income-statement", period, force_refresh
+        )
         return IncomeStatement(ticker=ticker, period=period, data=data.get("financials", []))
 
-    def get_cashflow_statement(self, ticker: str, period: str = "annual") -> CashFlowStatement:
+    def get_cashflow_statement(
+        self, ticker: str, period: str = "annual", force_refresh: bool = False
+    ) -> CashFlowStatement:
         """Fetch cash flow statement."""
-        data = self._get_cached_or_fetch(ticker, "financials/cash-flow-statement", period)
+        data = self._get_cached_or_fetch(
+            ticker, "financials/cash-flow-statement", period, force_refresh
+        )
         return CashFlowStatement(ticker=ticker, period=period, data=data.get("financials", []))
 
-    def get_balance_statement(self, ticker: str, period: str = "annual") -> BalanceStatement:
+    def get_balance_statement(
+        self, ticker: str, period: str = "annual", force_refresh: bool = False
+    ) -> BalanceStatement:
         """Fetch balance sheet statement."""
-        data = self._get_cached_or_fetch(ticker, "financials/balance-sheet-statement", period)
+        data = self._get_cached_or_fetch(
+            ticker, "financials/balance-sheet-statement", period, force_refresh
+        )
         return BalanceStatement(ticker=ticker, period=period, data=data.get("financials", []))
 
-    def get_stock_price(self, ticker: str) -> Dict[str, float]:
+    def get_stock_price(self, ticker: str, force_refresh: bool = False) -> Dict[str, float]:
         """Fetch current stock price."""
-        url = f"{config.api.base_url}/stock/real-time-price/{ticker}?apikey={self.api_key}"
-        data = self._fetch_json_data(url)
+        data = self._get_cached_or_fetch(ticker, REAL_TIME_PRICE, force_refresh=force_refresh)
+        return self._parse_stock_price(ticker, data)
 
+    def _stock_price_url(self, ticker: str) -> str:
+        """Build the real-time price URL for a ticker."""
+        return self._build_url(REAL_TIME_PRICE, ticker)
+
+    def _parse_stock_price(self, ticker: str, data: APIResponse) -> Dict[str, float]:
+        """Validate a real-time price response."""
         # Validate stock price data
         if "price" not in data:
             raise DataFetchError(f"Missing price data for {ticker}")
@@ -190,61 +770,270 @@ class FinancialDataFetcher:
         return {"symbol": ticker, "price": price}
 
     def get_batch_stock_prices(self, tickers: List[str]) -> Dict[str, float]:
-        """Fetch stock prices for multiple tickers."""
+        """
+        Fetch stock prices for multiple tickers.
+
+        Cached quotes are used first. The rest are requested through the
+        comma-joined batch endpoint, ``BATCH_PRICE_MAX_TICKERS`` at a time, and
+        any ticker a batch response does not cover is retried on its own.
+        """
         prices = {}
-        for ticker in tickers:
+        missing = []
+        for ticker in dict.fromkeys(tickers):
+            cached = self._load_cached(ticker, REAL_TIME_PRICE, "annual")
+            if cached is None:
+                missing.append(ticker)
+                continue
             try:
-                price_data = self.get_stock_price(ticker)
-                prices[ticker] = price_data["price"]
-            except (APIError, DataFetchError) as e:
-                logger.error(f"Error fetching price for {ticker}: {e}")
+                prices[ticker] = self._parse_stock_price(ticker, cached)["price"]
+            except DataFetchError:
+                missing.append(ticker)
+
+        for start in range(0, len(missing), BATCH_PRICE_MAX_TICKERS):
+            prices.update(self._get_price_chunk(missing[start : start + BATCH_PRICE_MAX_TICKERS]))
+
+        # The single-ticker lookups are independent round-trips, so overlap them
+        retry = [ticker for ticker in missing if ticker not in prices]
+        if retry:
+            with ThreadPoolExecutor(max_workers=self._batch_workers(len(retry))) as executor:
+                for ticker, price in zip(retry, executor.map(self._get_price_or_none, retry)):
+                    if price is not None:
+                        prices[ticker] = price
+
+        return {ticker: prices[ticker] for ticker in tickers if ticker in prices}
+
+    def _get_price_chunk(self, tickers: List[str]) -> Dict[str, float]:
+        """Fetch prices for up to ``BATCH_PRICE_MAX_TICKERS`` tickers in one request."""
+        url = self._build_url(REAL_TIME_PRICE, ",".join(tickers))
+        try:
+            data = self._fetch_json_data(url)
+        except (APIError, DataFetchError) as e:
+            logger.warning(f"Batch price request failed, fetching tickers one by one: {e}")
+            return {}
+
+        # Several symbols come back as a list; a single symbol as a bare quote
+        rows = data.get("companiesPriceList", [data]) if isinstance(data, dict) else data
+        wanted = set(tickers)
+
+        prices = {}
+        for row in rows:
+            if not isinstance(row, dict) or row.get("symbol") not in wanted:
                 continue
-            except (ValueError, TypeError, AttributeError) as e:
-                logger.error(f"Unexpected error fetching price for {ticker}: {e}")
+
+            ticker = row["symbol"]
+            try:
+                stock_quote = self._parse_stock_price(ticker, row)
+            except DataFetchError as e:
+                logger.warning(f"Invalid batch quote, retrying {ticker} on its own: {e}")
                 continue
+
+            prices[ticker] = stock_quote["price"]
+            if self.caching and self.cache_service:
+                self._store_cached(ticker, REAL_TIME_PRICE, "annual", stock_quote)
+
         return prices
 
+    def _get_price_or_none(self, ticker: str) -> Optional[float]:
+        """Fetch one ticker's price for a batch, logging and skipping failures."""
+        try:
+            return self.get_stock_price(ticker)["price"]
+        except (APIError, DataFetchError) as e:
+            logger.error(f"Error fetching price for {ticker}: {e}")
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.error(f"Unexpected error fetching price for {ticker}: {e}")
+        return None
+
     def get_historical_share_prices(self, ticker: str, dates: List[str]) -> Dict[str, float]:
-        """Fetch historical stock prices for given dates."""
-        prices = {}
+        """
+        Fetch historical stock prices for given dates.
+
+        Dates found in the cache are served from it; the rest are covered by a
+        single ranged request whose rows are split back into per-date entries.
+        Spans wider than the API's maximum range fall back to one request per date.
+        """
+        parsed = {}
         for date in dates:
             try:
-                # Calculate date range for API call
-                date_start = date[0:8] + str(int(date[8:]) - 2)
-                date_end = date
+                parsed[date] = datetime.date.fromisoformat(date)
+            except ValueError as e:
+                logger.error(f"Error parsing date '{date}': {e}")
 
-                url = (
-                    f"{config.api.base_url}/historical-price-full/{ticker}"
-                    f"?from={date_start}&to={date_end}&apikey={self.api_key}"
+        prices = {}
+        missing = []
+        for date in parsed:
+            cached = self._load_cached(ticker, HISTORICAL_PRICE, date)
+            if cached is None:
+                missing.append(date)
+                continue
+            close_price = self._parse_close_price(ticker, date, cached)
+            if close_price is not None:
+                prices[date] = close_price
+
+        if missing:
+            start = min(parsed[date] for date in missing) - datetime.timedelta(
+                days=HISTORICAL_WINDOW_DAYS
+            )
+            end = max(parsed[date] for date in missing)
+            if (end - start).days > config.api.historical_max_range_days:
+                prices.update(self._get_historical_share_prices_per_date(ticker, missing))
+            else:
+                prices.update(
+                    self._get_historical_share_prices_in_range(ticker, missing, start, end)
                 )
 
-                data = self._fetch_json_data(url)
+        return {date: prices[date] for date in dates if date in prices}
 
-                # Validate historical price data
-                if "historical" not in data or not data["historical"]:
-                    logger.warning(f"No historical data available for {ticker} on {date_end}")
-                    continue
+    def _get_historical_share_prices_in_range(
+        self, ticker: str, dates: List[str], start: datetime.date, end: datetime.date
+    ) -> Dict[str, float]:
+        """Fetch close prices for ``dates`` with one request spanning ``start``..``end``."""
+        url = self._historical_url_template.format(
+            ticker=quote(ticker, safe=","), start=start.isoformat(), end=end.isoformat()
+        )
+        try:
+            data = self._fetch_json_data(url)
+            rows = sorted(data.get("historical") or [], key=lambda row: row["date"], reverse=True)
+        except (APIError, DataFetchError) as e:
+            logger.error(f"Error fetching historical prices for {ticker}: {e}")
+            return {}
+        except (KeyError, TypeError, AttributeError) as e:
+            logger.error(f"Unexpected error fetching historical prices for {ticker}: {e}")
+            return {}
 
-                close_price = data["historical"][0]["close"]
-                if not isinstance(close_price, (int, float)) or close_price <= 0:
-                    logger.warning(f"Invalid close price for {ticker} on {date_end}: {close_price}")
-                    continue
+        prices = {}
+        for date in dates:
+            window_start = _historical_window_start(date)
+            window = {
+                "symbol": ticker,
+                "historical": [row for row in rows if window_start <= row["date"] <= date],
+            }
+            close_price = self._parse_close_price(ticker, date, window)
+            if close_price is None:
+                continue
+
+            prices[date] = close_price
+            if self.caching and self.cache_service:
+                self._store_cached(ticker, HISTORICAL_PRICE, date, window)
+
+        return prices
+
+    def _get_historical_share_prices_per_date(
+        self, ticker: str, dates: List[str]
+    ) -> Dict[str, float]:
+        """Fetch close prices for ``dates`` with one concurrent request per date."""
+        with ThreadPoolExecutor(max_workers=self._batch_workers(len(dates))) as executor:
+            results = executor.map(
+                lambda date: self._get_historical_price_or_none(ticker, date), dates
+            )
+            return {date: price for date, price in zip(dates, results) if price is not None}
+
+    def _get_historical_price_or_none(self, ticker: str, date: str) -> Optional[float]:
+        """Fetch the close price for one date, logging and skipping failures."""
+        try:
+            data = self._get_cached_or_fetch(ticker, HISTORICAL_PRICE, date)
+            return self._parse_close_price(ticker, date, data)
+        except (ValueError, IndexError) as e:
+            logger.error(f"Error parsing date '{date}': {e}")
+            logger.debug(f"Traceback for date '{date}'", exc_info=True)
+        except (APIError, DataFetchError) as e:
+            logger.error(f"Error fetching historical price for {date}: {e}")
+        except (TypeError, AttributeError) as e:
+            logger.error(f"Unexpected error fetching historical price for {date}: {e}")
+        return None
+
+    def _historical_price_url(self, ticker: str, date: str) -> str:
+        """Build the historical price URL covering the few days up to ``date``."""
+        return self._build_url(HISTORICAL_PRICE, ticker, date)
+
+    def _parse_close_price(self, ticker: str, date: str, data: APIResponse) -> Optional[float]:
+        """Extract a valid close price from a historical price response."""
+        # Validate historical price data
+        if "historical" not in data or not data["historical"]:
+            logger.warning(f"No historical data available for {ticker} on {date}")
+            return None
+
+        close_price = data["historical"][0]["close"]
+        if not isinstance(close_price, (int, float)) or close_price <= 0:
+            logger.warning(f"Invalid close price for {ticker} on {date}: {close_price}")
+            return None
+
+        return close_price
+
+    async def aget_batch_stock_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """
+        Fetch stock prices for multiple tickers concurrently over HTTP/2.
+
+        Requires the optional ``httpx`` dependency.
+
+        Args:
+            tickers: Ticker symbols to price
 
-                prices[date_end] = close_price
+        Returns:
+            Mapping of ticker to price for every ticker that could be fetched
+        """
+        async with self._async_client() as client:
+            results = await asyncio.gather(
+                *(self._afetch_json_data(client, self._stock_price_url(t)) for t in tickers),
+                return_exceptions=True,
+            )
+
+        prices = {}
+        for ticker, result in zip(tickers, results):
+            try:
+                if isinstance(result, BaseException):
+                    raise result
+                prices[ticker] = self._parse_stock_price(ticker, result)["price"]
+            except (APIError, DataFetchError) as e:
+                logger.error(f"Error fetching price for {ticker}: {e}")
+            except (ValueError, TypeError, AttributeError) as e:
+                logger.error(f"Unexpected error fetching price for {ticker}: {e}")
+        return prices
+
+    async def aget_historical_share_prices(self, ticker: str, dates: List[str]) -> Dict[str, float]:
+        """
+        Fetch historical stock prices for the given dates concurrently over HTTP/2.
 
-            except (ValueError, IndexError) as e:
+        Requires the optional ``httpx`` dependency.
+
+        Args:
+            ticker: Company ticker symbol
+            dates: Dates (YYYY-MM-DD) to look up close prices for
+
+        Returns:
+            Mapping of date to close price for every date that could be fetched
+        """
+        urls = {}
+        for date in dates:
+            try:
+                urls[date] = self._historical_price_url(ticker, date)
+            except ValueError as e:
                 logger.error(f"Error parsing date '{date}': {e}")
-                logger.debug(traceback.format_exc())
-                continue
+
+        async with self._async_client() as client:
+            results = await asyncio.gather(
+                *(self._afetch_json_data(client, url) for url in urls.values()),
+                return_exceptions=True,
+            )
+
+        prices = {}
+        for date, result in zip(urls, results):
+            try:
+                if isinstance(result, BaseException):
+                    raise result
+                close_price = self._parse_close_price(ticker, date, result)
             except (APIError, DataFetchError) as e:
                 logger.error(f"Error fetching historical price for {date}: {e}")
-                continue
-            except (ValueError, TypeError, AttributeError) as e:
+            except (IndexError, KeyError, TypeError, AttributeError) as e:
                 logger.error(f"Unexpected error fetching historical price for {date}: {e}")
-                continue
-
+            else:
+                if close_price is not None:
+                    prices[date] = close_price
         return prices
 
+    def _batch_workers(self, count: int) -> int:
+        """Number of worker threads to use for a batch of ``count`` requests."""
+        return max(1, min(self.max_workers, count))
+
     def clear_cache(self, ticker: Optional[str] = None, data_type: Optional[str] = None) -> None:
         """
         Clear cached data.
@@ -253,6 +1042,16 @@ class FinancialDataFetcher:
             ticker: Specific ticker to clear (if None, clears all)
             data_type: Specific data type to clear (if None, clears all)
         """
+        with self._memory_cache_lock:
+            stale = [
+                key
+                for key in self._memory_cache
+                if (ticker is None or key[0] == ticker)
+                and (data_type is None or key[1] == data_type)
+            ]
+            for key in stale:
+                del self._memory_cache[key]
+
         if self.cache_service:
             self.cache_service.clear_cache(ticker, data_type)
 
@@ -268,52 +1067,87 @@ class FinancialDataFetcher:
         return {"error": "Caching is disabled"}
 
 
+def _to_float(value: object) -> float:
+    """Coerce an API value to float, mapping unparseable values to NaN."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def to_statement_frame(statement: FinancialStatement) -> StatementFrame:
+    """
+    Convert a row-oriented statement into a column-oriented StatementFrame.
+
+    Args:
+        statement: Statement as returned by the ``get_*_statement`` methods
+
+    Returns:
+        StatementFrame with one float64 array per field
+    """
+    rows = statement["data"]
+    if not isinstance(rows, list):
+        rows = []
+
+    dates = [str(row.get("date", "")) for row in rows]
+    fields = [key for key in (rows[0] if rows else {}) if key != "date"]
+    columns = {
+        field: np.fromiter(
+            (_to_float(row.get(field)) for row in rows), dtype=np.float64, count=len(rows)
+        )
+        for field in fields
+    }
+    return StatementFrame(
+        ticker=statement["ticker"], period=statement["period"], dates=dates, columns=columns
+    )
+
+
 # Legacy functions for backward compatibility
 def get_api_url(requested_data: str, ticker: str, period: str, apikey: str) -> str:
     """Legacy function - use FinancialDataFetcher instead."""
-    fetcher = FinancialDataFetcher(apikey)
+    fetcher = _fetcher_for(apikey)
     return fetcher._build_url(requested_data, ticker, period)
 
 
 def get_jsonparsed_data(url: str) -> APIResponse:
     """Legacy function - use FinancialDataFetcher instead."""
-    fetcher = FinancialDataFetcher()
+    fetcher = _fetcher_for("")
     return fetcher._fetch_json_data(url)
 
 
 def get_ev_statement(ticker: str, period: str = "annual", apikey: str = "") -> APIResponse:
     """Legacy function - use FinancialDataFetcher instead."""
-    fetcher = FinancialDataFetcher(apikey)
+    fetcher = _fetcher_for(apikey)
     return fetcher.get_enterprise_value_statement(ticker, period)["data"]
 
 
 def get_income_statement(ticker: str, period: str = "annual", apikey: str = "") -> APIResponse:
     """Legacy function - use FinancialDataFetcher instead."""
-    fetcher = FinancialDataFetcher(apikey)
+    fetcher = _fetcher_for(apikey)
     return {"financials": fetcher.get_income_statement(ticker, period)["data"]}
 
 
 def get_cashflow_statement(ticker: str, period: str = "annual", apikey: str = "") -> APIResponse:
     """Legacy function - use FinancialDataFetcher instead."""
-    fetcher = FinancialDataFetcher(apikey)
+    fetcher = _fetcher_for(apikey)
     return {"financials": fetcher.get_cashflow_statement(ticker, period)["data"]}
 
 
 def get_balance_statement(ticker: str, period: str = "annual", apikey: str = "") -> APIResponse:
     """Legacy function - use FinancialDataFetcher instead."""
-    fetcher = FinancialDataFetcher(apikey)
+    fetcher = _fetcher_for(apikey)
     return {"financials": fetcher.get_balance_statement(ticker, period)["data"]}
 
 
 def get_stock_price(ticker: str, apikey: str = "") -> Dict[str, float]:
     """Legacy function - use FinancialDataFetcher instead."""
-    fetcher = FinancialDataFetcher(apikey)
+    fetcher = _fetcher_for(apikey)
     return fetcher.get_stock_price(ticker)
 
 
 def get_batch_stock_prices(tickers: List[str], apikey: str = "") -> Dict[str, float]:
     """Legacy function - use FinancialDataFetcher instead."""
-    fetcher = FinancialDataFetcher(apikey)
+    fetcher = _fetcher_for(apikey)
     return fetcher.get_batch_stock_prices(tickers)
 
 
@@ -321,7 +1155,7 @@ def get_historical_share_prices(
     ticker: str, dates: List[str], apikey: str = ""
 ) -> Dict[str, float]:
     """Legacy function - use FinancialDataFetcher instead."""
-    fetcher = FinancialDataFetcher(apikey)
+    fetcher = _fetcher_for(apikey)
     return fetcher.get_historical_share_prices(ticker, dates)
 
 
@@ -0,0 +1,32 @@
+"""
+Sensitivity analysis variables for the financial forecasting application.
+
+Kept free of numpy so the command line parser can import it cheaply.
+"""
+
+from enum import Enum
+from types import MappingProxyType
+
+
+class SensitivityVariable(Enum):
+    """Enum for sensitivity analysis variables."""
+
+    EARNINGS_GROWTH_RATE = "earnings_growth_rate"
+    DISCOUNT_RATE = "discount_rate"
+    CAP_EX_GROWTH_RATE = "cap_ex_growth_rate"
+    PERPETUAL_GROWTH_RATE = "perpetual_growth_rate"
+
+
+# Accepted --variable spellings (full names and short aliases)
+SENSITIVITY_VARIABLE_ALIASES = MappingProxyType(
+    {
+        "eg": SensitivityVariable.EARNINGS_GROWTH_RATE,
+        "earnings_growth_rate": SensitivityVariable.EARNINGS_GROWTH_RATE,
+        "cg": SensitivityVariable.CAP_EX_GROWTH_RATE,
+        "cap_ex_growth_rate": SensitivityVariable.CAP_EX_GROWTH_RATE,
+        "pg": SensitivityVariable.PERPETUAL_GROWTH_RATE,
+        "perpetual_growth_rate": SensitivityVariable.PERPETUAL_GROWTH_RATE,
+        "discount_rate": SensitivityVariable.DISCOUNT_RATE,
+        "discount": SensitivityVariable.DISCOUNT_RATE,
+    }
+)
@@ -1,13 +1,34 @@
 """
 Services package for the financial forecasting application.
+
+Services are imported on first access (PEP 562), so importing one of them
+doesn't pull in the others and their dependencies, e.g. matplotlib for the
+visualization service.
 """
 
-from .application_service import ApplicationService
-from .cache_service import CacheService
-from .dcf_service import DCFService
-from .error_handler import ErrorHandler
-from .validation_service import ValidationService
-from .visualization_service import VisualizationService
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .application_service import ApplicationService
+    from .cache_service import CacheService, get_cache_service
+    from .dcf_service import DCFService
+    from .error_handler import ErrorHandler
+    from .validation_service import ValidationService, get_validation_service
+    from .visualization_service import VisualizationService, get_visualization_service
+
+# Public name -> submodule defining it
+_LAZY_IMPORTS = {
+    "ApplicationService": "application_service",
+    "CacheService": "cache_service",
+    "DCFService": "dcf_service",
+    "ErrorHandler": "error_handler",
+    "ValidationService": "validation_service",
+    "VisualizationService": "visualization_service",
+    "get_cache_service": "cache_service",
+    "get_validation_service": "validation_service",
+    "get_visualization_service": "visualization_service",
+}
 
 __all__ = [
     "ApplicationService",
@@ -16,4 +37,24 @@ __all__ = [
     "ErrorHandler",
     "ValidationService",
     "VisualizationService",
+    "get_cache_service",
+    "get_validation_service",
+    "get_visualization_service",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the submodule defining ``name`` the first time it is accessed."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported names alongside the module's own attributes."""
+    return sorted(set(globals()) | set(__all__))
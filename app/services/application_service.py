@@ -7,12 +7,15 @@ including single analysis and sensitivity analysis modes.
 
 import argparse
 import logging
+from typing import Optional
+
+import numpy as np
 
 from app.custom_types import DCFParameters, DCFResults, SensitivityVariable
 from app.exceptions import DCFCalculationError
 from app.services.dcf_service import DCFService
 from app.services.error_handler import ErrorHandler
-from app.services.validation_service import ValidationService
+from app.services.validation_service import ValidationService, get_validation_service
 from app.services.visualization_service import VisualizationService
 
 # Configure logging for this module
@@ -31,6 +34,9 @@ class ApplicationService:
         """
         Initialize the application service.
 
+        The DCF service, and with it the data fetcher's HTTP session and
+        in-memory caches, is created once here and shared by every analysis run.
+
         Args:
             args: Command line arguments containing analysis parameters
         """
@@ -40,14 +46,16 @@ class ApplicationService:
         self.error_handler = ErrorHandler()
 
     def run_analysis(
-        self, args: argparse.Namespace, validation_service: ValidationService
+        self,
+        args: Optional[argparse.Namespace] = None,
+        validation_service: Optional[ValidationService] = None,
     ) -> DCFResults:
         """
         Run DCF analysis (single or sensitivity) based on parameters.
 
         Args:
-            args: Command line arguments
-            validation_service: Validation service instance
+            args: Command line arguments (defaults to those given at construction)
+            validation_service: Validation service instance (defaults to the shared one)
 
         Returns:
             DCF calculation results normalized with ticker as key
@@ -55,6 +63,11 @@ class ApplicationService:
         Raises:
             DCFCalculationError: If analysis fails
         """
+        if args is None:
+            args = self.args
+        if validation_service is None:
+            validation_service = get_validation_service()
+
         try:
             # Create base DCF parameters
             params = self._create_dcf_parameters(args)
@@ -63,7 +76,7 @@ class ApplicationService:
                 # Sensitivity analysis mode
                 variable = validation_service.get_variable_for_sensitivity(args)
                 dcfs = self._run_sensitivity_steps(args, variable)
-                logger.info(f"Completed sensitivity analysis with {len(dcfs)} steps")
+                logger.info("Completed sensitivity analysis with %d steps", len(dcfs))
             else:
                 # Single analysis mode
                 dcfs = self.dcf_service.calculate_historical_dcf(params)
@@ -98,28 +111,20 @@ class ApplicationService:
         step_increase = args.step_increase
         steps = args.steps
 
-        logger.info(f"Running sensitivity analysis for {variable.value}")
-        logger.info(f"Base value: {base_value}, Step: {step_increase}, Steps: {steps}")
+        logger.info("Running sensitivity analysis for %s", variable.value)
+        logger.info("Base value: %s, Step: %s, Steps: %s", base_value, step_increase, steps)
 
-        dcfs = {}
-
-        for step in range(steps + 1):
-            # Calculate new value for this step
-            new_value = base_value + (step * step_increase)
+        # Only one field changes per step, so every step is valued in a single
+        # vectorized evaluation over the array of step values
+        base_params = self._create_dcf_parameters(args)
+        values = base_value + step_increase * np.arange(steps + 1)
+        results = self.dcf_service.calculate_historical_dcf_sweep(base_params, variable, values)
 
-            # Create step label
+        dcfs = {}
+        for step, (new_value, step_dcfs) in enumerate(zip(values.tolist(), results)):
             step_label = self._create_step_label(variable, new_value)
-
-            # Create parameters with modified value
-            params = self._create_dcf_parameters_with_variable(args, variable, new_value)
-
-            # Run DCF calculation
-            step_dcfs = self.dcf_service.calculate_historical_dcf(params)
-
-            # Store results with step label
             dcfs[step_label] = step_dcfs
-
-            logger.info(f"Completed step {step + 1}/{steps + 1}: {step_label}")
+            logger.info("Completed step %d/%d: %s", step + 1, steps + 1, step_label)
 
         return dcfs
 
@@ -140,19 +145,6 @@ class ApplicationService:
         """Create a descriptive step label."""
         return f"{variable.value}: {value:.3f}"
 
-    def _create_dcf_parameters_with_variable(
-        self, args: argparse.Namespace, variable: SensitivityVariable, new_value: float
-    ) -> DCFParameters:
-        """Create DCF parameters with the modified variable value."""
-        # Create a copy of args to avoid mutating the original
-        args_dict = vars(args).copy()
-        args_dict[variable.value] = new_value
-
-        # Create a new Namespace object with the modified values
-        modified_args = argparse.Namespace(**args_dict)
-
-        return self._create_dcf_parameters(modified_args)
-
     def _create_dcf_parameters(self, args: argparse.Namespace) -> DCFParameters:
         """
         Create DCF parameters from command line arguments.
@@ -190,7 +182,11 @@ class ApplicationService:
             api_key=getattr(args, "apikey", None),
         )
 
-    def run(self, validation_service: ValidationService, args: argparse.Namespace) -> None:
+    def run(
+        self,
+        validation_service: Optional[ValidationService] = None,
+        args: Optional[argparse.Namespace] = None,
+    ) -> None:
         """
         Main application execution logic for DCF analysis.
 
@@ -205,8 +201,9 @@ class ApplicationService:
         or sensitivity analysis based on the provided parameters.
 
         Args:
-            validation_service: Validation service instance
+            validation_service: Validation service instance (defaults to the shared one)
             args: Command line arguments containing all analysis parameters
+                (defaults to those given at construction)
 
         Analysis Modes:
         ---------------
@@ -220,6 +217,9 @@ class ApplicationService:
         - Generated charts saved to 'app/imgs/' directory
         - Comprehensive DCF dashboard visualization
         """
+        if args is None:
+            args = self.args
+
         try:
             # Run DCF analysis (single or sensitivity)
             dcfs = self.run_analysis(args, validation_service)
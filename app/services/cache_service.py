@@ -5,13 +5,40 @@ This module handles caching of financial data to avoid repeated API calls
 and improve application performance.
 """
 
+import copy
+import functools
 import json
-from datetime import datetime, timedelta
+import mmap
+import os
+import tempfile
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, BinaryIO, Dict, Iterator, Optional
 
 from app.exceptions import ConfigurationError
 
+try:
+    import orjson
+except ImportError:  # Optional dependency, cache files are handled with stdlib json instead
+    orjson = None
+
+SECONDS_PER_DAY = 86400
+
+# Time-to-live per data type, matched to how often the provider updates the data:
+# filed statements change quarterly at most, quotes change constantly
+CACHE_TTL_SECONDS = MappingProxyType(
+    {
+        "enterprise-value": 90 * SECONDS_PER_DAY,
+        "financials/income-statement": 90 * SECONDS_PER_DAY,
+        "financials/balance-sheet-statement": 90 * SECONDS_PER_DAY,
+        "financials/cash-flow-statement": 90 * SECONDS_PER_DAY,
+        "stock/real-time-price": 60,
+        "historical-price-full": 7 * SECONDS_PER_DAY,
+    }
+)
+
 
 class CacheService:
     """Service for caching financial data locally."""
@@ -26,9 +53,21 @@ class CacheService:
         self.cache_directory = Path(cache_directory or "app/cache")
         self.cache_directory.mkdir(parents=True, exist_ok=True)
 
-        # Default cache expiration (24 hours)
+        # Default cache expiration (24 hours) for data types without their own TTL
         self.default_expiration_hours = 24
 
+    def get_ttl_seconds(self, data_type: str) -> float:
+        """
+        Get the time-to-live for cached data of the given type.
+
+        Args:
+            data_type: Type of financial data
+
+        Returns:
+            Number of seconds a cache entry of this type stays valid
+        """
+        return CACHE_TTL_SECONDS.get(data_type, self.default_expiration_hours * 3600)
+
     def get_cache_key(self, ticker: str, data_type: str, period: str = "annual") -> str:
         """
         Generate a cache key for the given parameters.
@@ -68,14 +107,44 @@ class CacheService:
         Returns:
             True if cache is valid, False otherwise
         """
-        if not cache_path.exists():
+        max_age = (expiration_hours or self.default_expiration_hours) * 3600
+        try:
+            return time.time() - os.path.getmtime(cache_path) < max_age
+        except FileNotFoundError:
             return False
 
-        expiration_hours = expiration_hours or self.default_expiration_hours
-        file_age = datetime.now() - datetime.fromtimestamp(cache_path.stat().st_mtime)
-        return file_age < timedelta(hours=expiration_hours)
+    def _entry_expires_at(
+        self, cache_entry: Dict[str, Any], mtime: float, expiration_hours: Optional[int] = None
+    ) -> float:
+        """
+        Get the time (seconds since the epoch) at which a loaded cache entry expires.
 
-    def save_data(self, ticker: str, data_type: str, data: dict, period: str = "annual") -> None:
+        An explicit ``expiration_hours`` overrides the TTL stored in the entry.
+        Entries written before TTLs were recorded fall back to the file's
+        modification time and the TTL for their data type.
+        """
+        if expiration_hours:
+            ttl = expiration_hours * 3600
+        else:
+            ttl = cache_entry.get("ttl_seconds") or self.get_ttl_seconds(
+                cache_entry.get("data_type", "")
+            )
+        return cache_entry.get("fetched_at", mtime) + ttl
+
+    def _is_entry_fresh(
+        self, cache_entry: Dict[str, Any], mtime: float, expiration_hours: Optional[int] = None
+    ) -> bool:
+        """Check a loaded cache entry against its time-to-live."""
+        return self._entry_expires_at(cache_entry, mtime, expiration_hours) > time.time()
+
+    def save_data(
+        self,
+        ticker: str,
+        data_type: str,
+        data: dict,
+        period: str = "annual",
+        validators: Optional[Dict[str, str]] = None,
+    ) -> None:
         """
         Save data to cache.
 
@@ -84,22 +153,64 @@ class CacheService:
             data_type: Type of financial data
             data: Data to cache
             period: Data period ('annual' or 'quarter')
+            validators: HTTP cache validators ('etag', 'last_modified') of the response
         """
-        cache_key = self.get_cache_key(ticker, data_type, period)
-        cache_path = self.get_cache_path(cache_key)
-
         cache_entry = {
             "ticker": ticker,
             "data_type": data_type,
             "period": period,
             "cached_at": datetime.now().isoformat(),
+            "fetched_at": time.time(),
+            "ttl_seconds": self.get_ttl_seconds(data_type),
+            **(validators or {}),
             "data": data,
         }
+        self._write_entry(ticker, data_type, period, cache_entry)
+
+    def refresh_entry(
+        self, ticker: str, data_type: str, cache_entry: Dict[str, Any], period: str = "annual"
+    ) -> None:
+        """
+        Restart the time-to-live of an existing entry whose data is still current.
+
+        Used after the API answers a conditional request with 304 Not Modified.
 
+        Args:
+            ticker: Company ticker symbol
+            data_type: Type of financial data
+            cache_entry: Entry as returned by ``load_entry``
+            period: Data period ('annual' or 'quarter')
+        """
+        cache_entry = {
+            **cache_entry,
+            "cached_at": datetime.now().isoformat(),
+            "fetched_at": time.time(),
+            "ttl_seconds": self.get_ttl_seconds(data_type),
+        }
+        self._write_entry(ticker, data_type, period, cache_entry)
+
+    def _write_entry(
+        self, ticker: str, data_type: str, period: str, cache_entry: Dict[str, Any]
+    ) -> None:
+        """
+        Write a cache entry to its file.
+
+        The entry is written to a temporary file that then replaces the cache
+        file, so readers (including the background cache writer's) never see a
+        partially written file and every write gets a new modification time.
+        """
+        cache_path = self.get_cache_path(self.get_cache_key(ticker, data_type, period))
+        tmp_path = None
         try:
-            with open(cache_path, "w") as f:
-                json.dump(cache_entry, f, indent=2, default=str)
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=self.cache_directory, suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
+                f.write(_dump_json(cache_entry))
+            os.replace(tmp_path, cache_path)
         except (OSError, IOError, ValueError, TypeError) as e:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
             raise ConfigurationError(f"Failed to save cache for {ticker}: {e}")
 
     def load_data(
@@ -119,24 +230,82 @@ class CacheService:
             expiration_hours: Hours until cache expires
 
         Returns:
-            Cached data if valid, None otherwise
+            Cached data if valid, None otherwise. The data is a copy the caller
+            may modify.
         """
-        cache_key = self.get_cache_key(ticker, data_type, period)
-        cache_path = self.get_cache_path(cache_key)
+        loaded = self.load_data_with_expiry(ticker, data_type, period, expiration_hours)
+        return loaded[0] if loaded is not None else None
 
-        if not self.is_cache_valid(cache_path, expiration_hours):
+    def load_data_with_expiry(
+        self,
+        ticker: str,
+        data_type: str,
+        period: str = "annual",
+        expiration_hours: Optional[int] = None,
+    ) -> Optional[tuple[Any, float]]:
+        """
+        Load data from cache if valid, along with the time it expires.
+
+        Args:
+            ticker: Company ticker symbol
+            data_type: Type of financial data
+            period: Data period ('annual' or 'quarter')
+            expiration_hours: Hours until cache expires
+
+        Returns:
+            Tuple of a copy of the cached data and its expiry time (seconds since
+            the epoch), or None if nothing valid is cached
+        """
+        loaded = self._read_entry(ticker, data_type, period)
+        if loaded is None:
             return None
 
+        cache_entry, mtime = loaded
+        expires_at = self._entry_expires_at(cache_entry, mtime, expiration_hours)
+        if expires_at <= time.time():
+            return None
+
+        return copy.deepcopy(cache_entry.get("data")), expires_at
+
+    def load_entry(
+        self, ticker: str, data_type: str, period: str = "annual"
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load a cache entry, including its metadata, whether or not it has expired.
+
+        Args:
+            ticker: Company ticker symbol
+            data_type: Type of financial data
+            period: Data period ('annual' or 'quarter')
+
+        Returns:
+            A copy of the stored entry, or None if nothing readable is cached
+        """
+        loaded = self._read_entry(ticker, data_type, period)
+        return copy.deepcopy(loaded[0]) if loaded is not None else None
+
+    def _read_entry(
+        self, ticker: str, data_type: str, period: str
+    ) -> Optional[tuple[Dict[str, Any], float]]:
+        """Read a cache file, returning the entry and the file's modification time."""
+        cache_path = self.get_cache_path(self.get_cache_key(ticker, data_type, period))
+
         try:
-            with open(cache_path, "r") as f:
-                cache_entry = json.load(f)
-                return cache_entry.get("data")
+            stat = os.stat(cache_path)
+            cache_entry = _load_entry_file(str(cache_path), stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
         except (OSError, IOError, ValueError, TypeError, json.JSONDecodeError):
             # If cache file is corrupted, remove it
             if cache_path.exists():
                 cache_path.unlink()
             return None
 
+        if not isinstance(cache_entry, dict):
+            return None
+
+        return cache_entry, stat.st_mtime
+
     def clear_cache(self, ticker: Optional[str] = None, data_type: Optional[str] = None) -> None:
         """
         Clear cache files.
@@ -160,6 +329,8 @@ class CacheService:
                     continue
                 cache_file.unlink()
 
+        _load_entry_file.cache_clear()
+
     def get_cache_info(self) -> Dict[str, Any]:
         """
         Get information about cached data.
@@ -167,34 +338,111 @@ class CacheService:
         Returns:
             Dictionary with cache statistics
         """
-        cache_files = list(self.cache_directory.glob("*.json"))
-        total_size = sum(f.stat().st_size for f in cache_files)
+        files = list(self.iter_cache_info())
+        total_size = sum(file_info["size_bytes"] for file_info in files)
 
-        cache_info = {
-            "total_files": len(cache_files),
+        return {
+            "total_files": len(files),
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
             "cache_directory": str(self.cache_directory),
-            "files": [],
+            "files": files,
         }
 
-        for cache_file in cache_files:
-            try:
-                with open(cache_file, "r") as f:
-                    cache_entry = json.load(f)
-                    cache_info["files"].append(
-                        {
-                            "file": cache_file.name,
-                            "ticker": cache_entry.get("ticker"),
-                            "data_type": cache_entry.get("data_type"),
-                            "cached_at": cache_entry.get("cached_at"),
-                            "size_bytes": cache_file.stat().st_size,
-                            "is_valid": self.is_cache_valid(cache_file),
-                        }
-                    )
-            except (OSError, IOError, ValueError, TypeError, json.JSONDecodeError):
-                cache_info["files"].append(
-                    {"file": cache_file.name, "error": "Corrupted cache file"}
-                )
-
-        return cache_info
+    def iter_cache_info(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over information about each cached file.
+
+        Files are yielded one at a time while the cache directory is being
+        scanned, so callers can report on large caches without holding the
+        whole inventory in memory.
+
+        Yields:
+            Dictionary describing one cache file
+        """
+        with os.scandir(self.cache_directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+
+                stat = entry.stat()
+                try:
+                    cache_entry = _load_entry_file(entry.path, stat.st_mtime_ns, stat.st_size)
+                except (OSError, IOError, ValueError, TypeError, json.JSONDecodeError):
+                    yield {
+                        "file": entry.name,
+                        "size_bytes": stat.st_size,
+                        "error": "Corrupted cache file",
+                    }
+                    continue
+
+                yield {
+                    "file": entry.name,
+                    "ticker": cache_entry.get("ticker"),
+                    "data_type": cache_entry.get("data_type"),
+                    "cached_at": cache_entry.get("cached_at"),
+                    "size_bytes": stat.st_size,
+                    "is_valid": self._is_entry_fresh(cache_entry, stat.st_mtime),
+                }
+
+
+def _dump_json(cache_entry: Dict[str, Any]) -> bytes:
+    """
+    Encode a cache entry as compact JSON bytes.
+
+    Uses orjson when available (numpy values included); values neither encoder
+    supports are stored as strings.
+    """
+    if orjson is None:
+        return json.dumps(cache_entry, separators=(",", ":"), default=str).encode()
+    return orjson.dumps(cache_entry, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_entry_file(path: str, mtime_ns: int, size: int) -> Any:  # noqa: ANN401, ARG001
+    """
+    Decode a cache file, memoized on its path, modification time and size.
+
+    A rewritten file gets a new key, so repeated loads within a run skip the
+    read and JSON decode until the file changes. The returned entry is shared
+    between callers, so ``load_data`` and ``load_entry`` hand out copies.
+
+    Raises:
+        OSError: If the file can't be read
+        ValueError: If the file is empty or does not contain valid JSON
+    """
+    with open(path, "rb") as f:
+        return _load_json_file(f)
+
+
+def _load_json_file(f: BinaryIO) -> Any:  # noqa: ANN401
+    """
+    Decode the JSON document in an open binary cache file.
+
+    With orjson available the file is memory-mapped and parsed straight from the
+    mapped pages, avoiding a copy of large statement files onto the Python heap.
+
+    Raises:
+        ValueError: If the file is empty or does not contain valid JSON
+    """
+    if orjson is None:
+        return json.loads(f.read())
+
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped)
+        try:
+            return orjson.loads(view)
+        finally:
+            # The mapping can only be closed once no views of it remain
+            view.release()
+
+
+@functools.lru_cache(maxsize=1)
+def get_cache_service() -> CacheService:
+    """
+    Get the process-wide cache service for the default cache directory.
+
+    Returns:
+        Shared CacheService instance
+    """
+    return CacheService()
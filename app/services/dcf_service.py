@@ -44,17 +44,58 @@ Where:
 - n = Number of forecast years
 """
 
+import functools
 import logging
-from decimal import Decimal
-from typing import Dict, Optional, Tuple
-
-from app.custom_types import DCFParameters, DCFResult, DCFResults
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from app.custom_types import (
+    DCFParameters,
+    DCFResult,
+    DCFResults,
+    SensitivityVariable,
+    StatementFrame,
+)
 from app.exceptions import DCFCalculationError
-from app.modeling.data import FinancialDataFetcher
+from app.modeling.data import FinancialDataFetcher, to_statement_frame
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# Rates (and the values derived from them) are scalars for a single DCF and
+# arrays with one element per step for a sensitivity sweep
+FloatOrArray = Union[float, np.ndarray]
+
+# Enterprise value, income, balance sheet and cash flow statements of one company
+Statements = Tuple[StatementFrame, StatementFrame, StatementFrame, StatementFrame]
+
+
+def _geometric_series_sum(ratio: FloatOrArray, terms: int) -> FloatOrArray:
+    """
+    Sum ``ratio ** k`` for k = 1..terms in closed form.
+
+    Args:
+        ratio: Common ratio of the series, or an array of ratios
+        terms: Number of terms
+
+    Returns:
+        The series sum (``terms`` itself where the ratio is 1), a float for a
+        scalar ratio and an array otherwise
+    """
+    ratio = np.asarray(ratio, dtype=np.float64)
+    at_one = np.isclose(ratio, 1.0, rtol=0.0, atol=1e-12)
+    # Entries with a ratio of 1 are skipped by the division and keep ``terms``
+    total = np.divide(
+        ratio * (1 - ratio**terms),
+        1 - ratio,
+        out=np.full(ratio.shape, float(terms)),
+        where=~at_one,
+    )
+    return total if total.ndim else float(total)
+
 
 class DCFService:
     """Service for handling DCF calculations."""
@@ -69,6 +110,42 @@ class DCFService:
         """
         self.data_fetcher = FinancialDataFetcher(api_key, caching)
 
+        # Statements per (ticker, interval), converted once and reused by every
+        # DCF computed in this service (historical periods and sensitivity steps)
+        self._statements: Dict[Tuple[str, str], Statements] = {}
+        self._statements_lock = threading.Lock()
+
+    def _get_statements(self, ticker: str, interval: str) -> Statements:
+        """
+        Fetch the four statements for a company once and reuse them afterwards.
+
+        The four statements are independent requests to the same host, so they
+        are fetched concurrently over the fetcher's pooled connections. Concurrent
+        callers wait for the first fetch instead of repeating it.
+
+        Args:
+            ticker: Company ticker symbol
+            interval: Data interval (annual/quarter)
+
+        Returns:
+            Enterprise value, income, balance sheet and cash flow statement frames
+        """
+        key = (ticker, interval)
+        with self._statements_lock:
+            statements = self._statements.get(key)
+            if statements is None:
+                getters = (
+                    self.data_fetcher.get_enterprise_value_statement,
+                    self.data_fetcher.get_income_statement,
+                    self.data_fetcher.get_balance_statement,
+                    self.data_fetcher.get_cashflow_statement,
+                )
+                with ThreadPoolExecutor(max_workers=len(getters)) as executor:
+                    futures = [executor.submit(getter, ticker, interval) for getter in getters]
+                    statements = tuple(to_statement_frame(future.result()) for future in futures)
+                self._statements[key] = statements
+        return statements
+
     def calculate_dcf(
         self,
         ticker: str,
@@ -98,46 +175,38 @@ class DCFService:
             DCFCalculationError: If calculation fails
         """
         try:
-            # Fetch financial data
-            ev_statement = self.data_fetcher.get_enterprise_value_statement(ticker, interval)
-            income_statement = self.data_fetcher.get_income_statement(ticker, interval)
-            balance_statement = self.data_fetcher.get_balance_statement(ticker, interval)
-            cashflow_statement = self.data_fetcher.get_cashflow_statement(ticker, interval)
-
-            # Calculate enterprise value
-            enterprise_val = self._calculate_enterprise_value(
-                income_statement["data"][0:2],
-                cashflow_statement["data"][0:2],
-                balance_statement["data"][0:2],
+            # Fetch financial data, converted to columns once per service
+            statements = self._get_statements(ticker, interval)
+
+            date, enterprise_val, equity_val, share_price = self._value_period(
+                statements,
+                0,
                 forecast_years,
                 discount_rate,
                 earnings_growth_rate,
                 cap_ex_growth_rate,
                 perpetual_growth_rate,
             )
-
-            # Calculate equity value and share price
-            equity_val, share_price = self._calculate_equity_value(
-                enterprise_val, ev_statement["data"][0]
-            )
-
-            # Print results
-            self._print_dcf_results(ticker, enterprise_val, equity_val, share_price)
-
-            return DCFResult(
-                date=income_statement["data"][0]["date"],
-                enterprise_value=enterprise_val,
-                equity_value=equity_val,
-                share_price=share_price,
-            )
-
         except Exception as e:
             raise DCFCalculationError(f"DCF calculation failed for {ticker}: {e}") from e
 
+        # Print results
+        self._print_dcf_results(ticker, enterprise_val, equity_val, share_price)
+
+        return DCFResult(
+            date=date,
+            enterprise_value=enterprise_val,
+            equity_value=equity_val,
+            share_price=share_price,
+        )
+
     def calculate_historical_dcf(self, params: DCFParameters) -> DCFResults:
         """
         Calculate DCF values over a historical timeframe.
 
+        Each interval is valued from its own statement period, most recent first.
+        The statements are fetched once and shared by every interval.
+
         Args:
             params: DCFParameters containing all calculation parameters
 
@@ -145,46 +214,179 @@ class DCFService:
             Dictionary mapping dates to DCF results
 
         Raises:
-            DCFCalculationError: If data fetching fails
+            DCFCalculationError: If data fetching or the calculation fails
         """
         dcfs: DCFResults = {}
 
-        # Determine number of intervals
-        intervals = params.years * (4 if params.interval == "quarter" else 1)
+        try:
+            statements = self._get_statements(params.ticker, params.interval)
+
+            for index in range(self._count_intervals(params, statements)):
+                date, enterprise_val, equity_val, share_price = self._value_period(
+                    statements,
+                    index,
+                    params.forecast_years,
+                    params.discount_rate,
+                    params.earnings_growth_rate,
+                    params.cap_ex_growth_rate,
+                    params.perpetual_growth_rate,
+                )
+                self._print_dcf_results(params.ticker, enterprise_val, equity_val, share_price)
+                dcfs[date] = DCFResult(
+                    date=date,
+                    enterprise_value=enterprise_val,
+                    equity_value=equity_val,
+                    share_price=share_price,
+                )
+        except Exception as e:
+            raise DCFCalculationError(f"DCF calculation failed for {params.ticker}: {e}") from e
 
-        # Fetch all financial
-        self.data_fetcher.get_enterprise_value_statement(params.ticker, params.interval)
-        self.data_fetcher.get_income_statement(params.ticker, params.interval)
-        self.data_fetcher.get_balance_statement(params.ticker, params.interval)
-        self.data_fetcher.get_cashflow_statement(params.ticker, params.interval)
-
-        for _ in range(intervals):
-            dcf_result = self.calculate_dcf(
-                params.ticker,
-                params.forecast_years,
-                params.discount_rate,
-                params.earnings_growth_rate,
-                params.cap_ex_growth_rate,
-                params.perpetual_growth_rate,
-                params.interval,
-            )
-            dcfs[dcf_result.date] = dcf_result
         return dcfs
 
+    def calculate_historical_dcf_sweep(
+        self, params: DCFParameters, variable: SensitivityVariable, values: np.ndarray
+    ) -> List[DCFResults]:
+        """
+        Calculate historical DCFs for a sensitivity sweep over one rate.
+
+        The statements are fetched once and each interval is valued for every
+        value of ``variable`` at once with NumPy broadcasting.
+
+        Args:
+            params: Base DCFParameters; the ``variable`` field takes each value in turn
+            variable: Rate varied across the sweep
+            values: Values of ``variable``, one per step
+
+        Returns:
+            Historical DCF results for each value, in the same order
+
+        Raises:
+            DCFCalculationError: If data fetching or the calculation fails
+        """
+        rates = {
+            "discount_rate": params.discount_rate,
+            "earnings_growth_rate": params.earnings_growth_rate,
+            "cap_ex_growth_rate": params.cap_ex_growth_rate,
+            "perpetual_growth_rate": params.perpetual_growth_rate,
+        }
+        rates[variable.value] = np.asarray(values, dtype=np.float64)
+        results: List[DCFResults] = [{} for _ in range(len(values))]
+
+        try:
+            statements = self._get_statements(params.ticker, params.interval)
+
+            for index in range(self._count_intervals(params, statements)):
+                # Fail on a zero denominator in any step, as a single DCF would
+                with np.errstate(divide="raise", invalid="raise"):
+                    date, enterprise_vals, equity_vals, share_prices = self._value_period(
+                        statements, index, params.forecast_years, **rates
+                    )
+
+                for step_dcfs, enterprise_val, equity_val, share_price in zip(
+                    results, enterprise_vals.tolist(), equity_vals.tolist(), share_prices.tolist()
+                ):
+                    self._print_dcf_results(params.ticker, enterprise_val, equity_val, share_price)
+                    step_dcfs[date] = DCFResult(
+                        date=date,
+                        enterprise_value=enterprise_val,
+                        equity_value=equity_val,
+                        share_price=share_price,
+                    )
+        except Exception as e:
+            raise DCFCalculationError(f"DCF calculation failed for {params.ticker}: {e}") from e
+
+        return results
+
+    def _count_intervals(self, params: DCFParameters, statements: Statements) -> int:
+        """
+        Number of historical intervals to value, capped by the periods available.
+
+        Args:
+            params: DCFParameters with the requested years and interval
+            statements: Statement frames of the company
+
+        Returns:
+            Number of statement periods to value, most recent first
+
+        Raises:
+            DCFCalculationError: If any statement has no periods at all
+        """
+        intervals = params.years * (4 if params.interval == "quarter" else 1)
+        available = min(len(statement) for statement in statements)
+        if available == 0:
+            raise DCFCalculationError(
+                f"No {params.interval} statement periods available for {params.ticker}"
+            )
+        if intervals > available:
+            logger.warning(
+                f"Only {available} {params.interval} periods available for {params.ticker}, "
+                f"{intervals} requested"
+            )
+        return min(intervals, available)
+
+    def _value_period(
+        self,
+        statements: Statements,
+        index: int,
+        forecast_years: int,
+        discount_rate: FloatOrArray,
+        earnings_growth_rate: FloatOrArray,
+        cap_ex_growth_rate: FloatOrArray,
+        perpetual_growth_rate: FloatOrArray,
+    ) -> Tuple[str, FloatOrArray, FloatOrArray, FloatOrArray]:
+        """
+        Value the company as of one statement period.
+
+        Args:
+            statements: Statement frames of the company
+            index: Statement period to value from (0 is the most recent)
+            forecast_years: Number of years to forecast
+            discount_rate: Discount rate for future cash flows
+            earnings_growth_rate: Assumed growth rate in earnings
+            cap_ex_growth_rate: Assumed growth rate in capital expenditures
+            perpetual_growth_rate: Assumed growth rate in perpetuity
+
+        Returns:
+            Tuple of (date, enterprise_value, equity_value, share_price)
+        """
+        ev_statement, income_statement, balance_statement, cashflow_statement = statements
+
+        # Calculate enterprise value
+        enterprise_val = self._calculate_enterprise_value(
+            income_statement,
+            cashflow_statement,
+            balance_statement,
+            forecast_years,
+            discount_rate,
+            earnings_growth_rate,
+            cap_ex_growth_rate,
+            perpetual_growth_rate,
+            index,
+        )
+
+        # Calculate equity value and share price
+        equity_val, share_price = self._calculate_equity_value(enterprise_val, ev_statement, index)
+
+        return income_statement.dates[index], enterprise_val, equity_val, share_price
+
     def _calculate_enterprise_value(
         self,
-        income_statement: list,
-        cashflow_statement: list,
-        balance_statement: list,
+        income_statement: StatementFrame,
+        cashflow_statement: StatementFrame,
+        balance_statement: StatementFrame,
         forecast_years: int,
-        discount_rate: float,
-        earnings_growth_rate: float,
-        cap_ex_growth_rate: float,
-        perpetual_growth_rate: float,
-    ) -> float:
+        discount_rate: FloatOrArray,
+        earnings_growth_rate: FloatOrArray,
+        cap_ex_growth_rate: FloatOrArray,
+        perpetual_growth_rate: FloatOrArray,
+        index: int = 0,
+    ) -> FloatOrArray:
         """
         Calculate enterprise value using DCF methodology.
 
+        The rates may be arrays, in which case one enterprise value is returned
+        per element (broadcast across a sensitivity sweep).
+
         Args:
             income_statement: Income statement data
             cashflow_statement: Cash flow statement data
@@ -194,35 +396,33 @@ class DCFService:
             earnings_growth_rate: Assumed growth rate in earnings
             cap_ex_growth_rate: Assumed growth rate in capital expenditures
             perpetual_growth_rate: Assumed growth rate in perpetuity
+            index: Statement period to value from (0 is the most recent)
 
         Returns:
             Calculated enterprise value
-        """
-        # Extract current period data
-        current_income = income_statement[0]
-        current_cashflow = cashflow_statement[0]
 
-        # Calculate unlevered free cash flow
-        ebit = float(current_income.get("EBIT", 0))
+        Raises:
+            DCFCalculationError: If EBIT is missing or not a number
+        """
+        # Calculate unlevered free cash flow from the valued period
+        ebit = income_statement.value("EBIT", index)
         tax_rate = 0.25  # Default tax rate - could be made configurable
-        non_cash_charges = float(current_cashflow.get("Depreciation & Amortization", 0))
-        cwc = self._calculate_change_in_working_capital(balance_statement)
-        cap_ex = abs(float(current_cashflow.get("Capital Expenditure", 0)))
+        non_cash_charges = cashflow_statement.value(
+            "Depreciation & Amortization", index, default=0.0
+        )
+        cwc = self._calculate_change_in_working_capital(balance_statement, index)
+        cap_ex = abs(cashflow_statement.value("Capital Expenditure", index, default=0.0))
 
         current_fcf = self._calculate_unlevered_fcf(ebit, tax_rate, non_cash_charges, cwc, cap_ex)
 
-        # Calculate present value of explicit period cash flows
-        pv_explicit = 0
-        for year in range(1, forecast_years + 1):
-            # Project future cash flows
-            future_fcf = current_fcf * (1 + earnings_growth_rate) ** year
-            future_cap_ex = cap_ex * (1 + cap_ex_growth_rate) ** year
-
-            # Adjust for projected capital expenditures
-            future_fcf -= future_cap_ex
-
-            # Discount to present value
-            pv_explicit += future_fcf / (1 + discount_rate) ** year
+        # Calculate present value of explicit period cash flows. Projected cash flows
+        # and capital expenditures each grow geometrically, so their discounted sums
+        # over the forecast years are geometric series with a closed form
+        pv_explicit = current_fcf * _geometric_series_sum(
+            (1 + earnings_growth_rate) / (1 + discount_rate), forecast_years
+        ) - cap_ex * _geometric_series_sum(
+            (1 + cap_ex_growth_rate) / (1 + discount_rate), forecast_years
+        )
 
         # Calculate terminal value
         terminal_fcf = current_fcf * (1 + earnings_growth_rate) ** forecast_years
@@ -234,24 +434,32 @@ class DCFService:
         return pv_explicit + pv_terminal
 
     def _calculate_equity_value(
-        self, enterprise_value: float, ev_statement: Dict
-    ) -> Tuple[float, float]:
+        self, enterprise_value: FloatOrArray, ev_statement: StatementFrame, index: int = 0
+    ) -> Tuple[FloatOrArray, FloatOrArray]:
         """
         Calculate equity value and share price from enterprise value.
 
         Args:
             enterprise_value: Calculated enterprise value
             ev_statement: Enterprise value statement data
+            index: Statement period to value from (0 is the most recent)
 
         Returns:
             Tuple of (equity_value, share_price)
+
+        Raises:
+            DCFCalculationError: If the share count is missing or not positive
         """
-        total_debt = ev_statement.get("addTotalDebt", 0)
-        cash_equivalents = ev_statement.get("minusCashAndCashEquivalents", 0)
-        number_of_shares = ev_statement.get("numberOfShares", 1)
+        total_debt = ev_statement.value("addTotalDebt", index, default=0.0)
+        cash_equivalents = ev_statement.value("minusCashAndCashEquivalents", index, default=0.0)
+        number_of_shares = ev_statement.value("numberOfShares", index)
+        if number_of_shares <= 0:
+            raise DCFCalculationError(
+                f"Invalid numberOfShares for {ev_statement.ticker}: {number_of_shares}"
+            )
 
         equity_val = enterprise_value - total_debt + cash_equivalents
-        share_price = equity_val / float(number_of_shares)
+        share_price = equity_val / number_of_shares
 
         return equity_val, share_price
 
@@ -273,29 +481,27 @@ class DCFService:
         """
         return ebit * (1 - tax_rate) + non_cash_charges + cwc + cap_ex
 
-    def _calculate_change_in_working_capital(self, balance_statement: list) -> float:
+    def _calculate_change_in_working_capital(
+        self, balance_statement: StatementFrame, index: int = 0
+    ) -> float:
         """
         Calculate change in working capital.
 
         Args:
             balance_statement: Balance sheet data
+            index: Period whose change from the period before it is calculated
 
         Returns:
             Change in working capital
         """
-        if len(balance_statement) < 2:
+        if len(balance_statement) < index + 2:
             return 0
 
-        current = balance_statement[0]
-        previous = balance_statement[1]
-
-        current_wc = float(current.get("Total current assets", 0)) - float(
-            current.get("Total current liabilities", 0)
-        )
-        previous_wc = float(previous.get("Total current assets", 0)) - float(
-            previous.get("Total current liabilities", 0)
+        current_wc, previous_wc = (
+            balance_statement.value("Total current assets", i, default=0.0)
+            - balance_statement.value("Total current liabilities", i, default=0.0)
+            for i in (index, index + 1)
         )
-
         return current_wc - previous_wc
 
     def _print_dcf_results(
@@ -310,9 +516,20 @@ class DCFService:
             equity_val: Calculated equity value
             share_price: Calculated share price
         """
-        logger.info(f"\nEnterprise Value for {ticker}: ${'%.2E' % Decimal(str(enterprise_val))}.")
-        logger.info(f"\nEquity Value for {ticker}: ${'%.2E' % Decimal(str(equity_val))}.")
-        logger.info(f"\nPer share value for {ticker}: ${'%.2E' % Decimal(str(share_price))}.\n")
+        # Called for every period of every sensitivity step; skip the formatting
+        # entirely when INFO is disabled
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        logger.info(f"\nEnterprise Value for {ticker}: ${enterprise_val:.2E}.")
+        logger.info(f"\nEquity Value for {ticker}: ${equity_val:.2E}.")
+        logger.info(f"\nPer share value for {ticker}: ${share_price:.2E}.\n")
+
+
+@functools.lru_cache(maxsize=8)
+def _service_for(api_key: str) -> DCFService:
+    """Service reused by the legacy historical_dcf for a given API key."""
+    return DCFService(api_key)
 
 
 # Legacy function for backward compatibility
@@ -347,7 +564,7 @@ def historical_dcf(
     Note:
         This function is deprecated. Use DCFService.calculate_historical_dcf() instead.
     """
-    service = DCFService(api_key)
+    service = _service_for(api_key)
     params = DCFParameters(
         ticker=ticker,
         years=years,
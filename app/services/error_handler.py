@@ -5,9 +5,12 @@ This module provides centralized error handling and logging for all application
 components, ensuring consistent error reporting and debugging information.
 """
 
+import functools
 import logging
 import traceback
-from typing import Any, Callable, Dict, Optional, TypeVar
+from collections import Counter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Type, TypeVar
 
 from app.exceptions import (
     APIError,
@@ -18,12 +21,74 @@ from app.exceptions import (
     VisualizationError,
 )
 
-# Configure logging for this module
+# Configure logging for this module. Records logged by ErrorHandler carry the
+# tracked category and context as `error_kind` / `error_context` attributes, so
+# handlers and formatters can use them (e.g. "%(error_kind)s") without parsing
+# the message.
 logger = logging.getLogger(__name__)
 
 # Type variable for generic function return type
 T = TypeVar("T")
 
+# Log message prefix and context label for each application error type
+_ERROR_LABELS: Mapping[Type[Exception], Tuple[str, str]] = MappingProxyType(
+    {
+        APIError: ("API error", "API"),
+        DataFetchError: ("Data fetching error", "Data"),
+        InvalidParameterError: ("Validation error", "Validation"),
+        DCFCalculationError: ("DCF calculation error", "DCF"),
+        VisualizationError: ("Visualization error", "Visualization"),
+        ConfigurationError: ("Configuration error", "Configuration"),
+    }
+)
+
+# Exceptions safe_execute catches; those without labels are reported as unexpected errors
+_SYSTEM_ERRORS = (OSError, ImportError, MemoryError)
+_CAUGHT_ERRORS = (
+    *_ERROR_LABELS,
+    ValueError,
+    TypeError,
+    AttributeError,
+    RuntimeError,
+    *_SYSTEM_ERRORS,
+)
+
+
+def _labels_for(error_type: Type[BaseException]) -> Optional[Tuple[str, str]]:
+    """
+    Look up the labels of the closest handled base class of an error type.
+
+    Args:
+        error_type: Type of the error being handled
+
+    Returns:
+        (message, label) pair from _ERROR_LABELS, or None if no base class of
+        error_type is a handled error type
+    """
+    for cls in error_type.__mro__:
+        labels = _ERROR_LABELS.get(cls)
+        if labels is not None:
+            return labels
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _context_key(error_type: str, context: str) -> str:
+    """
+    Build the error_contexts key for an error type and context.
+
+    The set of pairs is small, so keys are memoized and repeated errors reuse the
+    same string object (with its hash already computed).
+
+    Args:
+        error_type: Type of error that occurred
+        context: Context where the error occurred
+
+    Returns:
+        "error_type:context", or just error_type when there is no context
+    """
+    return f"{error_type}:{context}" if context else error_type
+
 
 class ErrorHandler:
     """Centralized error handling service."""
@@ -32,7 +97,7 @@ class ErrorHandler:
         """Initialize the error handler."""
         self.error_count = 0
         self.warning_count = 0
-        self.error_contexts: Dict[str, int] = {}
+        self.error_contexts: Counter[str] = Counter()
         self.last_error: Optional[Exception] = None
 
     def handle_api_error(self, error: APIError, context: str = "") -> None:
@@ -43,19 +108,7 @@ class ErrorHandler:
             error: The API error that occurred
             context: Additional context about where the error occurred
         """
-        self.error_count += 1
-        self.last_error = error
-        context_msg = f" in {context}" if context else ""
-
-        logger.error(f"API error{context_msg}: {error}")
-        self._track_error_context("API", context)
-
-        # Log additional context for debugging
-        if hasattr(error, "__cause__") and error.__cause__:
-            logger.debug(f"API error cause: {error.__cause__}")
-
-        # Log stack trace for debugging
-        logger.debug(f"API error stack trace: {traceback.format_exc()}")
+        self._handle(error, *_ERROR_LABELS[APIError], context)
 
     def handle_data_error(self, error: DataFetchError, context: str = "") -> None:
         """
@@ -65,19 +118,7 @@ class ErrorHandler:
             error: The data fetching error that occurred
             context: Additional context about where the error occurred
         """
-        self.error_count += 1
-        self.last_error = error
-        context_msg = f" in {context}" if context else ""
-
-        logger.error(f"Data fetching error{context_msg}: {error}")
-        self._track_error_context("Data", context)
-
-        # Log additional context for debugging
-        if hasattr(error, "__cause__") and error.__cause__:
-            logger.debug(f"Data error cause: {error.__cause__}")
-
-        # Log stack trace for debugging
-        logger.debug(f"Data error stack trace: {traceback.format_exc()}")
+        self._handle(error, *_ERROR_LABELS[DataFetchError], context)
 
     def handle_validation_error(self, error: InvalidParameterError, context: str = "") -> None:
         """
@@ -87,19 +128,7 @@ class ErrorHandler:
             error: The validation error that occurred
             context: Additional context about where the error occurred
         """
-        self.error_count += 1
-        self.last_error = error
-        context_msg = f" in {context}" if context else ""
-
-        logger.error(f"Validation error{context_msg}: {error}")
-        self._track_error_context("Validation", context)
-
-        # Log additional context for debugging
-        if hasattr(error, "__cause__") and error.__cause__:
-            logger.debug(f"Validation error cause: {error.__cause__}")
-
-        # Log stack trace for debugging
-        logger.debug(f"Validation error stack trace: {traceback.format_exc()}")
+        self._handle(error, *_ERROR_LABELS[InvalidParameterError], context)
 
     def handle_dcf_error(self, error: DCFCalculationError, context: str = "") -> None:
         """
@@ -109,19 +138,7 @@ class ErrorHandler:
             error: The DCF calculation error that occurred
             context: Additional context about where the error occurred
         """
-        self.error_count += 1
-        self.last_error = error
-        context_msg = f" in {context}" if context else ""
-
-        logger.error(f"DCF calculation error{context_msg}: {error}")
-        self._track_error_context("DCF", context)
-
-        # Log additional context for debugging
-        if hasattr(error, "__cause__") and error.__cause__:
-            logger.debug(f"DCF error cause: {error.__cause__}")
-
-        # Log stack trace for debugging
-        logger.debug(f"DCF error stack trace: {traceback.format_exc()}")
+        self._handle(error, *_ERROR_LABELS[DCFCalculationError], context)
 
     def handle_visualization_error(self, error: VisualizationError, context: str = "") -> None:
         """
@@ -131,19 +148,7 @@ class ErrorHandler:
             error: The visualization error that occurred
             context: Additional context about where the error occurred
         """
-        self.error_count += 1
-        self.last_error = error
-        context_msg = f" in {context}" if context else ""
-
-        logger.error(f"Visualization error{context_msg}: {error}")
-        self._track_error_context("Visualization", context)
-
-        # Log additional context for debugging
-        if hasattr(error, "__cause__") and error.__cause__:
-            logger.debug(f"Visualization error cause: {error.__cause__}")
-
-        # Log stack trace for debugging
-        logger.debug(f"Visualization error stack trace: {traceback.format_exc()}")
+        self._handle(error, *_ERROR_LABELS[VisualizationError], context)
 
     def handle_configuration_error(self, error: ConfigurationError, context: str = "") -> None:
         """
@@ -153,19 +158,38 @@ class ErrorHandler:
             error: The configuration error that occurred
             context: Additional context about where the error occurred
         """
+        self._handle(error, *_ERROR_LABELS[ConfigurationError], context)
+
+    def _handle(self, error: Exception, message: str, label: str, context: str) -> None:
+        """
+        Record and log a handled application error.
+
+        Args:
+            error: The error that occurred
+            message: Log message prefix, e.g. "API error"
+            label: Short error category used for context tracking and debug output
+            context: Additional context about where the error occurred
+        """
         self.error_count += 1
         self.last_error = error
         context_msg = f" in {context}" if context else ""
 
-        logger.error(f"Configuration error{context_msg}: {error}")
-        self._track_error_context("Configuration", context)
-
-        # Log additional context for debugging
-        if hasattr(error, "__cause__") and error.__cause__:
-            logger.debug(f"Configuration error cause: {error.__cause__}")
-
-        # Log stack trace for debugging
-        logger.debug(f"Configuration error stack trace: {traceback.format_exc()}")
+        logger.error(
+            "%s%s: %s",
+            message,
+            context_msg,
+            error,
+            extra={"error_kind": label, "error_context": context},
+        )
+        self._track_error_context(label, context)
+
+        # Log cause and stack trace for debugging; formatting the traceback walks
+        # every frame, so it is skipped entirely unless DEBUG is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            cause = error.__cause__
+            if cause is not None:
+                logger.debug("%s error cause: %s", label, cause)
+            logger.debug("%s error stack trace: %s", label, traceback.format_exc())
 
     def handle_unexpected_error(self, error: Exception, context: str = "") -> None:
         """
@@ -179,12 +203,18 @@ class ErrorHandler:
         self.last_error = error
         context_msg = f" in {context}" if context else ""
 
-        logger.error(f"Unexpected error{context_msg}: {error}")
+        logger.error(
+            "Unexpected error%s: %s",
+            context_msg,
+            error,
+            extra={"error_kind": "Unexpected", "error_context": context},
+        )
         self._track_error_context("Unexpected", context)
 
         # Log detailed error information
-        logger.debug(f"Unexpected error type: {type(error).__name__}")
-        logger.debug(f"Unexpected error traceback: {traceback.format_exc()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Unexpected error type: %s", type(error).__name__)
+            logger.debug("Unexpected error traceback: %s", traceback.format_exc())
 
     def handle_warning(self, message: str, context: str = "") -> None:
         """
@@ -197,7 +227,12 @@ class ErrorHandler:
         self.warning_count += 1
         context_msg = f" in {context}" if context else ""
 
-        logger.warning(f"Warning{context_msg}: {message}")
+        logger.warning(
+            "Warning%s: %s",
+            context_msg,
+            message,
+            extra={"error_kind": "Warning", "error_context": context},
+        )
         self._track_error_context("Warning", context)
 
     def safe_execute(
@@ -217,24 +252,15 @@ class ErrorHandler:
         """
         try:
             return func(*args, **kwargs)
-        except APIError as e:
-            self.handle_api_error(e, context)
-        except DataFetchError as e:
-            self.handle_data_error(e, context)
-        except InvalidParameterError as e:
-            self.handle_validation_error(e, context)
-        except DCFCalculationError as e:
-            self.handle_dcf_error(e, context)
-        except VisualizationError as e:
-            self.handle_visualization_error(e, context)
-        except ConfigurationError as e:
-            self.handle_configuration_error(e, context)
-        except (ValueError, TypeError, AttributeError, RuntimeError) as e:
-            self.handle_unexpected_error(e, context)
-        except (OSError, ImportError, MemoryError) as e:
-            # Catch specific system-level errors
-            logger.error(f"System error {type(e).__name__} in {context}: {e}")
-            self.handle_unexpected_error(e, context)
+        except _CAUGHT_ERRORS as e:
+            labels = _labels_for(type(e))
+            if labels is not None:
+                self._handle(e, *labels, context)
+            else:
+                if isinstance(e, _SYSTEM_ERRORS):
+                    # System-level errors get an extra log line naming the type
+                    logger.error("System error %s in %s: %s", type(e).__name__, context, e)
+                self.handle_unexpected_error(e, context)
 
         return None
 
@@ -246,8 +272,7 @@ class ErrorHandler:
             error_type: Type of error that occurred
             context: Context where the error occurred
         """
-        context_key = f"{error_type}:{context}" if context else error_type
-        self.error_contexts[context_key] = self.error_contexts.get(context_key, 0) + 1
+        self.error_contexts[_context_key(error_type, context)] += 1
 
     def get_error_summary(self) -> Dict[str, Any]:
         """
@@ -260,7 +285,7 @@ class ErrorHandler:
             "error_count": self.error_count,
             "warning_count": self.warning_count,
             "total_issues": self.error_count + self.warning_count,
-            "error_contexts": self.error_contexts.copy(),
+            "error_contexts": dict(self.error_contexts),
             "last_error": str(self.last_error) if self.last_error else None,
             "last_error_type": type(self.last_error).__name__ if self.last_error else None,
         }
@@ -297,4 +322,4 @@ class ErrorHandler:
         Returns:
             Dictionary mapping error contexts to their counts
         """
-        return self.error_contexts.copy()
+        return dict(self.error_contexts)
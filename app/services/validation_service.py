@@ -6,11 +6,58 @@ principles for robust input validation and error handling.
 """
 
 import argparse
-from typing import Dict, Optional, Union
+import functools
+from types import MappingProxyType
+from typing import Optional
 
-from app.custom_types import SensitivityVariable
+from app.custom_types import SENSITIVITY_VARIABLE_ALIASES, SensitivityVariable
 from app.exceptions import InvalidParameterError
 
+# Business logic constraints for numeric parameters
+PARAMETER_CONSTRAINTS = MappingProxyType(
+    {
+        "period": {"min": 1, "max": 20, "description": "Forecast period"},
+        "years": {"min": 1, "max": 10, "description": "Historical years"},
+        "discount_rate": {"min": 0.01, "max": 0.50, "description": "Discount rate"},
+        "earnings_growth_rate": {
+            "min": -0.50,
+            "max": 1.0,
+            "description": "Earnings growth rate",
+        },
+        "cap_ex_growth_rate": {
+            "min": -0.50,
+            "max": 1.0,
+            "description": "Capital expenditure growth rate",
+        },
+        "perpetual_growth_rate": {
+            "min": 0.0,
+            "max": 0.10,
+            "description": "Perpetual growth rate",
+        },
+        "step_increase": {"min": 0.001, "max": 1.0, "description": "Step increase"},
+        "steps": {"min": 1, "max": 50, "description": "Number of steps"},
+    }
+)
+
+# Reporting intervals supported by the data provider
+_VALID_INTERVALS = frozenset({"annual", "quarter"})
+
+# Parameters only checked when a sensitivity analysis is requested
+_SENSITIVITY_PARAMETERS = frozenset({"step_increase", "steps"})
+
+# PARAMETER_CONSTRAINTS flattened to (name, min, max, description) rows for the validation loop,
+# split so a single analysis never visits the sensitivity-only parameters
+_BASE_CONSTRAINT_BOUNDS = tuple(
+    (name, constraint["min"], constraint["max"], constraint["description"])
+    for name, constraint in PARAMETER_CONSTRAINTS.items()
+    if name not in _SENSITIVITY_PARAMETERS
+)
+_SENSITIVITY_CONSTRAINT_BOUNDS = _BASE_CONSTRAINT_BOUNDS + tuple(
+    (name, constraint["min"], constraint["max"], constraint["description"])
+    for name, constraint in PARAMETER_CONSTRAINTS.items()
+    if name in _SENSITIVITY_PARAMETERS
+)
+
 
 class ValidationService:
     """
@@ -23,43 +70,6 @@ class ValidationService:
     - User-Friendly: Provides clear error messages
     """
 
-    def __init__(self) -> None:
-        """Initialize the validation service."""
-        self._variable_mapping = {
-            "eg": SensitivityVariable.EARNINGS_GROWTH_RATE,
-            "earnings_growth_rate": SensitivityVariable.EARNINGS_GROWTH_RATE,
-            "cg": SensitivityVariable.CAP_EX_GROWTH_RATE,
-            "cap_ex_growth_rate": SensitivityVariable.CAP_EX_GROWTH_RATE,
-            "pg": SensitivityVariable.PERPETUAL_GROWTH_RATE,
-            "perpetual_growth_rate": SensitivityVariable.PERPETUAL_GROWTH_RATE,
-            "discount_rate": SensitivityVariable.DISCOUNT_RATE,
-            "discount": SensitivityVariable.DISCOUNT_RATE,
-        }
-
-        # Business logic constraints
-        self._constraints = {
-            "period": {"min": 1, "max": 20, "description": "Forecast period"},
-            "years": {"min": 1, "max": 10, "description": "Historical years"},
-            "discount_rate": {"min": 0.01, "max": 0.50, "description": "Discount rate"},
-            "earnings_growth_rate": {
-                "min": -0.50,
-                "max": 1.0,
-                "description": "Earnings growth rate",
-            },
-            "cap_ex_growth_rate": {
-                "min": -0.50,
-                "max": 1.0,
-                "description": "Capital expenditure growth rate",
-            },
-            "perpetual_growth_rate": {
-                "min": 0.0,
-                "max": 0.10,
-                "description": "Perpetual growth rate",
-            },
-            "step_increase": {"min": 0.001, "max": 1.0, "description": "Step increase"},
-            "steps": {"min": 1, "max": 50, "description": "Number of steps"},
-        }
-
     def validate_all_parameters(self, args: argparse.Namespace) -> None:
         """
         Comprehensive validation of all parameters.
@@ -94,48 +104,34 @@ class ValidationService:
             raise InvalidParameterError("Ticker symbol is too long")
 
         # Interval validation
-        if args.interval not in ["annual", "quarter"]:
+        if args.interval not in _VALID_INTERVALS:
             raise InvalidParameterError("Interval must be either 'annual' or 'quarter'")
 
     def _validate_business_constraints(self, args: argparse.Namespace) -> None:
         """Validate business logic constraints for numeric parameters."""
-        # Check if we're doing sensitivity analysis
-        is_sensitivity_analysis = getattr(args, "step_increase", 0) > 0
-
-        for param_name, constraint in self._constraints.items():
-            if hasattr(args, param_name):
-                value = getattr(args, param_name)
-                if value is not None:
-                    # Skip sensitivity parameters if not doing sensitivity analysis
-                    if param_name in ["step_increase", "steps"] and not is_sensitivity_analysis:
-                        continue
-
-                    # For step_increase, allow 0 (which means no sensitivity analysis)
-                    if param_name == "step_increase" and value == 0:
-                        continue
-
-                    self._validate_numeric_constraint(value, constraint)
-
-    def _validate_numeric_constraint(
-        self, value: Union[float, str], constraint: Dict[str, Union[str, float]]
-    ) -> None:
-        """Validate a single numeric parameter against its constraints."""
-        try:
-            # Convert to float for validation
-            numeric_value = float(value)
-        except (ValueError, TypeError):
-            raise InvalidParameterError(
-                f"{constraint['description']} must be a valid number, got: {value}"
-            )
-
-        min_val = constraint["min"]
-        max_val = constraint["max"]
-
-        if numeric_value < min_val or numeric_value > max_val:
-            raise InvalidParameterError(
-                f"{constraint['description']} must be between {min_val} and {max_val}, "
-                f"got: {numeric_value}"
-            )
+        # Sensitivity parameters are only checked when doing sensitivity analysis;
+        # step_increase == 0 means no sensitivity analysis
+        values = vars(args)
+        if values.get("step_increase", 0) > 0:
+            bounds = _SENSITIVITY_CONSTRAINT_BOUNDS
+        else:
+            bounds = _BASE_CONSTRAINT_BOUNDS
+
+        for param_name, min_val, max_val, description in bounds:
+            value = values.get(param_name)
+            if value is None:
+                continue
+
+            try:
+                numeric_value = float(value)
+            except (ValueError, TypeError):
+                raise InvalidParameterError(f"{description} must be a valid number, got: {value}")
+
+            if numeric_value < min_val or numeric_value > max_val:
+                raise InvalidParameterError(
+                    f"{description} must be between {min_val} and {max_val}, "
+                    f"got: {numeric_value}"
+                )
 
     def _validate_sensitivity_parameters_if_needed(self, args: argparse.Namespace) -> None:
         """Validate sensitivity analysis parameters if they're being used."""
@@ -149,11 +145,10 @@ class ValidationService:
                 "For sensitivity analysis, you must specify --variable when --step_increase > 0"
             )
 
-        variable = self._get_variable_mapping(args.variable)
-        if variable is None:
-            valid_variables = [var.value for var in SensitivityVariable]
+        if self._get_variable_mapping(args.variable) is None:
             raise InvalidParameterError(
-                f"Invalid variable '{args.variable}'. Must choose from: {valid_variables}"
+                f"Invalid variable '{args.variable}'. "
+                f"Must choose from: {list(SENSITIVITY_VARIABLE_ALIASES)}"
             )
 
     def get_variable_for_sensitivity(self, args: argparse.Namespace) -> SensitivityVariable:
@@ -180,7 +175,8 @@ class ValidationService:
 
         return variable
 
-    def _get_variable_mapping(self, variable: str) -> Optional[SensitivityVariable]:
+    @staticmethod
+    def _get_variable_mapping(variable: str) -> Optional[SensitivityVariable]:
         """
         Map variable names to their internal representations.
 
@@ -190,7 +186,7 @@ class ValidationService:
         Returns:
             Mapped SensitivityVariable enum value or None if not found
         """
-        return self._variable_mapping.get(variable)
+        return SENSITIVITY_VARIABLE_ALIASES.get(variable)
 
     # Legacy methods for backward compatibility
     def validate_api_key(self, api_key: Optional[str]) -> None:
@@ -204,9 +200,20 @@ class ValidationService:
         """Legacy method - use validate_all_parameters instead."""
         self._validate_business_constraints(args)
 
-    def validate_sensitivity_parameters(self, args: argparse.Namespace) -> str:
+    def validate_sensitivity_parameters(self, args: argparse.Namespace) -> SensitivityVariable:
         """Legacy method - use get_variable_for_sensitivity instead."""
         if args.step_increase <= 0:
             raise InvalidParameterError("Step increase must be greater than 0")
 
         return self.get_variable_for_sensitivity(args)
+
+
+@functools.lru_cache(maxsize=1)
+def get_validation_service() -> ValidationService:
+    """
+    Get the process-wide validation service.
+
+    Returns:
+        Shared ValidationService instance
+    """
+    return ValidationService()
@@ -5,23 +5,73 @@ This module handles the creation of comprehensive financial visualizations inclu
 DCF dashboards, sensitivity analysis charts, and terminal-style outputs.
 """
 
+import functools
 import logging
 import os
-from datetime import datetime
+from datetime import date
+from typing import Dict, Tuple
 
+import matplotlib.artist
 import matplotlib.axes
-import matplotlib.pyplot as plt
+import matplotlib.style
 import numpy as np
 import seaborn as sns
+from matplotlib.figure import Figure
 
 from app.config import config
-from app.custom_types import DCFResult, DCFResults, VisualizationData
+from app.custom_types import DCFResult, DCFResults, DCFResultsFrame, VisualizationData
 from app.exceptions import VisualizationError
 from app.services.error_handler import ErrorHandler
 
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# Sample cash flow projection shown on the dashboard, in units of $10B
+FIRST_FORECAST_YEAR = 2025
+SAMPLE_DISCOUNTED_FCF_10B = np.array([9.72e10, 9.51e10, 9.80e10, 1.06e11, 1.20e11]) / 1e10
+SAMPLE_EBIT_10B = np.array([1.29e11, 1.42e11, 1.64e11, 1.96e11, 2.45e11]) / 1e10
+
+# Valuation metrics shown on the dashboard: the DCF value (highlighted) followed by
+# sample market metrics (could be made configurable or calculated)
+VALUATION_METRICS = ("DCF Value", "Market Price", "P/E Ratio", "P/B Ratio", "ROE")
+SAMPLE_MARKET_METRIC_VALUES = (227.79, 37.3, 35.2, 0.15)
+VALUATION_METRIC_COLORS = ("green",) + ("blue",) * len(SAMPLE_MARKET_METRIC_VALUES)
+
+# Sample risk factors shown on the dashboard (could be made configurable), scored
+# on a 0-1 scale and classified High (> 0.6) / Medium (> 0.4) / Low
+SAMPLE_RISK_FACTORS = (
+    "Market Risk",
+    "Interest Rate Risk",
+    "Currency Risk",
+    "Regulatory Risk",
+    "Competition Risk",
+)
+SAMPLE_RISK_SCORES = np.array([0.7, 0.5, 0.3, 0.6, 0.8])
+_RISK_BANDS = [SAMPLE_RISK_SCORES > 0.6, SAMPLE_RISK_SCORES > 0.4]
+SAMPLE_RISK_LEVELS = np.select(_RISK_BANDS, ["High", "Medium"], default="Low")
+SAMPLE_RISK_COLORS = np.select(_RISK_BANDS, ["red", "orange"], default="green")
+
+
+@functools.lru_cache(maxsize=None)
+def _apply_plotting_style(style: str, color_palette: str) -> None:
+    """
+    Apply a matplotlib style and seaborn palette to the global rcParams.
+
+    Memoized on its arguments, so every service after the first skips
+    re-merging the same style into rcParams.
+
+    Args:
+        style: Matplotlib style name
+        color_palette: Seaborn palette name
+    """
+    try:
+        matplotlib.style.use(style)
+        sns.set_palette(color_palette)
+    except (ValueError, OSError, RuntimeError) as e:
+        logger.warning(f"Failed to set plotting style: {e}")
+        # Fallback to default style
+        matplotlib.style.use("default")
+
 
 class VisualizationService:
     """Service for handling DCF visualization generation."""
@@ -29,17 +79,12 @@ class VisualizationService:
     def __init__(self) -> None:
         """Initialize the visualization service."""
         self.error_handler = ErrorHandler()
+        self._figures: Dict[str, Figure] = {}
         self._setup_plotting_style()
 
     def _setup_plotting_style(self) -> None:
         """Set up the plotting style and configuration."""
-        try:
-            plt.style.use(config.visualization.style)
-            sns.set_palette(config.visualization.color_palette)
-        except (ValueError, OSError, RuntimeError) as e:
-            logger.warning(f"Failed to set plotting style: {e}")
-            # Fallback to default style
-            plt.style.use("default")
+        _apply_plotting_style(config.visualization.style, config.visualization.color_palette)
 
     def display_results(self, ticker: str, dcfs: DCFResults) -> None:
         """
@@ -58,13 +103,13 @@ class VisualizationService:
                 return
 
             # Get the most recent result
-            latest_date = max(dcfs.keys())
-            latest_result = dcfs[latest_date]
+            frame = DCFResultsFrame.from_results(dcfs)
+            latest = int(frame.dates.argmax())
 
-            logger.info(f"\nDCF Results for {ticker} ({latest_date}):")
-            logger.info(f"Enterprise Value: ${latest_result.enterprise_value:,.2f}")
-            logger.info(f"Equity Value: ${latest_result.equity_value:,.2f}")
-            logger.info(f"Share Price: ${latest_result.share_price:.2f}")
+            logger.info(f"\nDCF Results for {ticker} ({frame.dates[latest]}):")
+            logger.info(f"Enterprise Value: ${frame.enterprise_value[latest]:,.2f}")
+            logger.info(f"Equity Value: ${frame.equity_value[latest]:,.2f}")
+            logger.info(f"Share Price: ${frame.share_price[latest]:.2f}")
 
         except (ValueError, KeyError, AttributeError) as e:
             error_msg = f"Error displaying results for {ticker}: {e}"
@@ -87,19 +132,20 @@ class VisualizationService:
         Raises:
             VisualizationError: If visualization generation fails
         """
-        logger.info(f"\n{'=' * 60}")
-        logger.info("Generating Enhanced Visualizations...")
-        logger.info("=" * 60)
+        banner = "=" * 60
+        logger.info(f"\n{banner}\nGenerating Enhanced Visualizations...\n{banner}")
 
         try:
             # Create visualizations
             self.create_comprehensive_visualization(ticker, dcf_results[ticker], forecast_years)
             self.create_terminal_style_output(ticker, dcf_results[ticker], forecast_years)
 
-            logger.info("Visualizations created successfully!")
-            logger.info("Check the 'app/imgs/' directory for generated charts:")
-            logger.info(f"   - {ticker}_comprehensive_dcf.png (Main dashboard)")
-            logger.info("   - terminal_output.png (Terminal-style output)")
+            logger.info(
+                "Visualizations created successfully!\n"
+                "Check the 'app/imgs/' directory for generated charts:\n"
+                f"   - {ticker}_comprehensive_dcf.png (Main dashboard)\n"
+                "   - terminal_output.png (Terminal-style output)"
+            )
 
         except Exception as e:
             error_msg = f"Failed to generate visualizations: {e}"
@@ -141,14 +187,15 @@ class VisualizationService:
             )
 
             # Create the visualization
-            self._create_dashboard(viz_data)
+            fig = self._create_dashboard(viz_data)
 
             # Save the file
             output_path = os.path.join(
                 config.visualization.output_directory, f"{ticker}_comprehensive_dcf.png"
             )
-            plt.savefig(output_path, dpi=config.visualization.dpi, bbox_inches="tight")
-            plt.close()
+            # _create_dashboard already fitted the layout with tight_layout(), so the
+            # extra draw bbox_inches="tight" needs to measure the content is skipped
+            fig.savefig(output_path, dpi=config.visualization.dpi)
 
             return output_path
 
@@ -191,12 +238,11 @@ class VisualizationService:
             )
 
             # Create terminal-style output
-            self._create_terminal_output(viz_data)
+            fig = self._create_terminal_output(viz_data)
 
             # Save the file
             output_path = os.path.join(config.visualization.output_directory, "terminal_output.png")
-            plt.savefig(output_path, dpi=config.visualization.dpi, bbox_inches="tight")
-            plt.close()
+            fig.savefig(output_path, dpi=config.visualization.dpi, bbox_inches="tight")
 
             return output_path
 
@@ -208,15 +254,19 @@ class VisualizationService:
             )
             raise VisualizationError(error_msg) from e
 
-    def _create_dashboard(self, viz_data: VisualizationData) -> None:
+    def _create_dashboard(self, viz_data: VisualizationData) -> Figure:
         """
         Create the main dashboard with multiple subplots.
 
         Args:
             viz_data: Visualization data containing DCF results
+
+        Returns:
+            The dashboard figure
         """
         try:
-            fig, axes = plt.subplots(2, 3, figsize=config.visualization.figure_size)
+            fig = self._get_figure("dashboard", config.visualization.figure_size)
+            axes = fig.subplots(2, 3)
             fig.suptitle(
                 f"DCF Analysis Dashboard - {viz_data.ticker}", fontsize=16, fontweight="bold"
             )
@@ -229,7 +279,8 @@ class VisualizationService:
             self._create_valuation_metrics(axes[1, 1], viz_data)
             self._create_risk_assessment(axes[1, 2])
 
-            plt.tight_layout()
+            fig.tight_layout()
+            return fig
         except Exception as e:
             error_msg = f"Failed to create dashboard: {e}"
             logger.error(error_msg)
@@ -303,9 +354,7 @@ class VisualizationService:
         )
 
         # Format the percentage labels
-        for autotext in autotexts:
-            autotext.set_color("white")
-            autotext.set_fontweight("bold")
+        matplotlib.artist.setp(autotexts, color="white", fontweight="bold")
 
         ax.set_title("Value Breakdown", fontsize=14, fontweight="bold")
 
@@ -320,16 +369,15 @@ class VisualizationService:
             viz_data: Visualization data containing DCF results
         """
         # Sample cash flow data (could be made configurable or calculated)
-        years = list(range(1, viz_data.forecast_years + 1))
-        dfcf = [9.72e10, 9.51e10, 9.80e10, 1.06e11, 1.20e11]
-        ebit = [1.29e11, 1.42e11, 1.64e11, 1.96e11, 2.45e11]
+        dfcf = SAMPLE_DISCOUNTED_FCF_10B[: viz_data.forecast_years]
+        ebit = SAMPLE_EBIT_10B[: viz_data.forecast_years]
 
-        x = np.arange(len(years))
+        x = np.arange(len(dfcf))
         width = 0.35
 
         ax.bar(
             x - width / 2,
-            [val / 1e10 for val in dfcf],
+            dfcf,
             width,
             label="Discounted FCF",
             color="skyblue",
@@ -337,7 +385,7 @@ class VisualizationService:
         )
         ax.bar(
             x + width / 2,
-            [val / 1e10 for val in ebit],
+            ebit,
             width,
             label="EBIT",
             color="lightcoral",
@@ -348,7 +396,7 @@ class VisualizationService:
         ax.set_ylabel("Value ($10B)")
         ax.set_title(f"{viz_data.forecast_years}-Year Cash Flow Projection")
         ax.set_xticks(x)
-        ax.set_xticklabels([f"202{5 + i}" for i in range(viz_data.forecast_years)])
+        ax.set_xticklabels(np.arange(FIRST_FORECAST_YEAR, FIRST_FORECAST_YEAR + len(x)).astype(str))
         ax.legend()
         ax.grid(True, alpha=0.3)
 
@@ -366,13 +414,10 @@ class VisualizationService:
         growth_rates = np.linspace(0.02, 0.08, 7)  # 2% to 8%
         discount_rates = np.linspace(0.08, 0.15, 8)  # 8% to 15%
 
-        # Create a simple sensitivity matrix
-        sensitivity_matrix = np.zeros((len(growth_rates), len(discount_rates)))
-
-        for i, growth in enumerate(growth_rates):
-            for j, discount in enumerate(discount_rates):
-                # Simplified sensitivity calculation
-                sensitivity_matrix[i, j] = viz_data.share_price * (1 + growth) / (1 + discount)
+        # Simplified sensitivity calculation, broadcast to a growth x discount grid
+        sensitivity_matrix = (
+            viz_data.share_price * (1 + growth_rates[:, np.newaxis]) / (1 + discount_rates)
+        )
 
         # Create heatmap
         im = ax.imshow(sensitivity_matrix, cmap="RdYlGn", aspect="auto")
@@ -388,7 +433,7 @@ class VisualizationService:
         ax.set_title("Sensitivity Analysis\n(Share Price)")
 
         # Add colorbar
-        cbar = plt.colorbar(im, ax=ax)
+        cbar = ax.figure.colorbar(im, ax=ax)
         cbar.set_label("Share Price ($)")
 
     def _create_valuation_metrics(
@@ -401,32 +446,21 @@ class VisualizationService:
             ax: Matplotlib axis object
             viz_data: Visualization data containing DCF results
         """
-        # Sample metrics (could be made configurable or calculated)
-        metrics = ["DCF Value", "Market Price", "P/E Ratio", "P/B Ratio", "ROE"]
-        values = [viz_data.share_price, 227.79, 37.3, 35.2, 0.15]  # Sample values
+        # The DCF value is compared against the sample market metrics
+        values = (viz_data.share_price, *SAMPLE_MARKET_METRIC_VALUES)
 
         # Create horizontal bar chart
-        y_pos = np.arange(len(metrics))
-        bars = ax.barh(
-            y_pos, values, color=["green" if i == 0 else "blue" for i in range(len(values))]
-        )
+        y_pos = np.arange(len(VALUATION_METRICS))
+        bars = ax.barh(y_pos, values, color=VALUATION_METRIC_COLORS)
 
         ax.set_yticks(y_pos)
-        ax.set_yticklabels(metrics)
+        ax.set_yticklabels(VALUATION_METRICS)
         ax.set_xlabel("Value")
         ax.set_title("Valuation Metrics")
         ax.grid(True, alpha=0.3)
 
         # Add value labels on bars
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            ax.text(
-                width + 0.01 * max(values),
-                bar.get_y() + bar.get_height() / 2,
-                f"{values[i]:.2f}",
-                ha="left",
-                va="center",
-            )
+        ax.bar_label(bars, labels=[f"{value:.2f}" for value in values], padding=3)
 
     def _create_risk_assessment(self, ax: matplotlib.axes.Axes) -> None:
         """
@@ -435,36 +469,20 @@ class VisualizationService:
         Args:
             ax: Matplotlib axis object
         """
-        # Sample risk factors (could be made configurable)
-        risk_factors = [
-            "Market Risk",
-            "Interest Rate Risk",
-            "Currency Risk",
-            "Regulatory Risk",
-            "Competition Risk",
-        ]
-        risk_scores = [0.7, 0.5, 0.3, 0.6, 0.8]  # 0-1 scale
-
-        colors = [
-            "red" if score > 0.6 else "orange" if score > 0.4 else "green" for score in risk_scores
-        ]
-
-        y_pos = np.arange(len(risk_factors))
-        bars = ax.barh(y_pos, risk_scores, color=colors, alpha=0.7)
+        y_pos = np.arange(len(SAMPLE_RISK_FACTORS))
+        bars = ax.barh(y_pos, SAMPLE_RISK_SCORES, color=SAMPLE_RISK_COLORS, alpha=0.7)
 
         ax.set_yticks(y_pos)
-        ax.set_yticklabels(risk_factors)
+        ax.set_yticklabels(SAMPLE_RISK_FACTORS)
         ax.set_xlabel("Risk Score (0-1)")
         ax.set_title("Risk Assessment")
         ax.set_xlim(0, 1)
         ax.grid(True, alpha=0.3)
 
         # Add risk level labels
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            risk_level = "High" if width > 0.6 else "Medium" if width > 0.4 else "Low"
+        for bar, risk_level in zip(bars, SAMPLE_RISK_LEVELS):
             ax.text(
-                width + 0.02,
+                bar.get_width() + 0.02,
                 bar.get_y() + bar.get_height() / 2,
                 risk_level,
                 ha="left",
@@ -472,7 +490,7 @@ class VisualizationService:
                 fontweight="bold",
             )
 
-    def _create_terminal_output(self, viz_data: VisualizationData) -> None:
+    def _create_terminal_output(self, viz_data: VisualizationData) -> Figure:
         """
         Create terminal-style output visualization.
 
@@ -480,10 +498,14 @@ class VisualizationService:
             viz_data: Visualization data containing DCF results
         """
         try:
-            fig, ax = plt.subplots(figsize=(12, 8))
+            fig = self._get_figure("terminal_output", (12, 8))
+            ax = fig.subplots()
             fig.patch.set_facecolor("black")
             ax.set_facecolor("black")
 
+            analysis_date = self._get_current_date()
+            dcf_defaults = config.dcf
+
             # Terminal-style text
             terminal_text = f"""
 ╔══════════════════════════════════════════════════════════════════════════════╗
@@ -491,7 +513,7 @@ class VisualizationService:
 ╠══════════════════════════════════════════════════════════════════════════════╣
 ║                                                                              ║
 ║  Company: {viz_data.ticker:<60} ║
-║  Analysis Date: {self._get_current_date():<50} ║
+║  Analysis Date: {analysis_date:<50} ║
 ║                                                                              ║
 ║  ┌──────────────────────────────────────────────────────────────────────────┐ ║
 ║  │                           VALUATION SUMMARY                              │ ║
@@ -505,8 +527,8 @@ class VisualizationService:
 ║  │                           KEY METRICS                                    │ ║
 ║  ├──────────────────────────────────────────────────────────────────────────┤ ║
 ║  │  Forecast Period:  {viz_data.forecast_years:>15} years                  │ ║
-║  │  Discount Rate:    {config.dcf.default_discount_rate:>15.1%}            │ ║
-║  │  Growth Rate:      {config.dcf.default_earnings_growth_rate:>15.1%}      │ ║
+║  │  Discount Rate:    {dcf_defaults.default_discount_rate:>15.1%}            │ ║
+║  │  Growth Rate:      {dcf_defaults.default_earnings_growth_rate:>15.1%}      │ ║
 ║  └──────────────────────────────────────────────────────────────────────────┘ ║
 ║                                                                              ║
 ║  ═══════════════════════════════════════════════════════════════════════════  ║
@@ -531,6 +553,7 @@ class VisualizationService:
             ax.set_xlim(0, 1)
             ax.set_ylim(0, 1)
             ax.axis("off")
+            return fig
         except Exception as e:
             error_msg = f"Failed to create terminal-style output: {e}"
             logger.error(error_msg)
@@ -539,14 +562,49 @@ class VisualizationService:
             )
             raise
 
+    def _get_figure(self, name: str, figsize: Tuple[float, float]) -> Figure:
+        """
+        Get a cleared figure for a chart, creating it on first use.
+
+        Figures are created outside pyplot and kept per chart, so repeated calls
+        reuse the same Figure and canvas instead of building new ones, and never
+        touch pyplot's current figure.
+
+        Args:
+            name: Chart name the figure is kept under
+            figsize: Figure size in inches, used when the figure is created
+
+        Returns:
+            Empty figure for the chart
+        """
+        fig = self._figures.get(name)
+        if fig is None:
+            fig = self._figures[name] = Figure(figsize=figsize)
+        else:
+            fig.clear()
+        return fig
+
     def _get_current_date(self) -> str:
         """
         Get current date in formatted string.
 
         Returns:
-            Current date as formatted string
+            Current date as a YYYY-MM-DD string
         """
-        return datetime.now().strftime("%Y-%m-%d")
+        return date.today().isoformat()
+
+
+@functools.lru_cache(maxsize=1)
+def get_visualization_service() -> VisualizationService:
+    """
+    Get the process-wide visualization service.
+
+    The plotting style is applied once, when the service is first created.
+
+    Returns:
+        Shared VisualizationService instance
+    """
+    return VisualizationService()
 
 
 # Legacy functions for backward compatibility
@@ -574,7 +632,7 @@ def create_dcf_visualization(
         This function is deprecated. Use VisualizationService.create_comprehensive_visualization()
         instead.
     """
-    service = VisualizationService()
+    service = get_visualization_service()
     # Create mock DCF results for backward compatibility
     mock_results = {
         "2024-01-01": DCFResult(
@@ -611,7 +669,7 @@ def create_terminal_style_output(
         This function is deprecated. Use VisualizationService.create_terminal_style_output()
         instead.
     """
-    service = VisualizationService()
+    service = get_visualization_service()
     # Create mock DCF results for backward compatibility
     mock_results = {
         "2024-01-01": DCFResult(
@@ -5,8 +5,8 @@ This module provides functions for creating various types of plots comparing
 DCF-forecasted share prices with historical share prices.
 """
 
+import functools
 import logging
-import sys
 from typing import Any, Dict
 
 import matplotlib.pyplot as plt
@@ -17,15 +17,36 @@ from app.modeling.data import get_historical_share_prices
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
-# Set modern seaborn theme (replaces deprecated sns.set())
-sns.set_theme(style="whitegrid", font_scale=1.0)
 
-# Add parent directory to path for imports
-sys.path.append("..")
+@functools.lru_cache(maxsize=1)
+def _apply_theme() -> None:
+    """Apply the seaborn theme used by these plots, once per process."""
+    # Set modern seaborn theme (replaces deprecated sns.set())
+    sns.set_theme(style="whitegrid", font_scale=1.0)
+
+
+def _show_or_close(show: bool) -> None:
+    """
+    Display the current figure, or close it when running without display.
+
+    Closing releases the figure's canvas and keeps the next plot from drawing
+    onto it. Headless runs can also select a non-GUI backend with MPLBACKEND=Agg.
+
+    Args:
+        show: Whether to display the figure
+    """
+    if show:
+        plt.show()
+    else:
+        plt.close()
 
 
 def visualize(
-    dcf_prices: Dict[str, Any], ticker: str, condition: Dict[str, Any], apikey: str
+    dcf_prices: Dict[str, Any],
+    ticker: str,
+    condition: Dict[str, Any],
+    apikey: str,
+    show: bool = True,
 ) -> None:
     """
     2d plot comparing dcf-forecasted per share price with historical share price.
@@ -35,24 +56,22 @@ def visualize(
         ticker: Company ticker symbol
         condition: Dictionary containing condition parameters
         apikey: API key for financial data services
+        show: Display the plot; when False the figure is only saved and then closed
     """
-    dcf_share_prices = {}
+    _apply_theme()
+    condition_name = next(iter(condition))
     try:
-        conditions = [str(cond) for cond in next(iter(condition.values()))]
+        conditions = [str(cond) for cond in condition[condition_name]]
     except IndexError:
         logger.error(f"Invalid condition format: {condition}")
         return
+    dcf_share_prices = {k: v["share_price"] for k, v in dcf_prices.items()}
+    dates = list(dcf_share_prices.keys())
+    share_prices = list(dcf_share_prices.values())
     for cond in conditions:
-        dcf_share_prices[cond] = {k: v["share_price"] for k, v in dcf_prices.items()}
-        plt.plot(
-            list(dcf_share_prices[cond].keys()),
-            list(dcf_share_prices[cond].values()),
-            label=f"DCF {cond}",
-        )
+        plt.plot(dates, share_prices, label=f"DCF {cond}")
     historical_stock_prices = get_historical_share_prices(
-        ticker=ticker,
-        dates=list(dcf_share_prices[next(iter(dcf_share_prices.keys()))].keys())[::-1],
-        apikey=apikey,
+        ticker=ticker, dates=dates[::-1], apikey=apikey
     )
     plt.plot(
         list(historical_stock_prices.keys()),
@@ -61,12 +80,16 @@ def visualize(
     )
     plt.legend(loc="upper right")
     plt.title("$" + ticker + "  ")
-    plt.savefig(f"imgs/{ticker}_{next(iter(condition.keys()))}.png")
-    plt.show()
+    plt.savefig(f"imgs/{ticker}_{condition_name}.png")
+    _show_or_close(show)
 
 
 def visualize_bulk_historicals(
-    dcfs: Dict[str, Any], ticker: str, condition: Dict[str, Any], apikey: str
+    dcfs: Dict[str, Any],
+    ticker: str,
+    condition: Dict[str, Any],
+    apikey: str,
+    show: bool = True,
 ) -> None:
     """
     Multiple 2d plot comparing historical DCFs of different growth assumption conditions.
@@ -76,33 +99,29 @@ def visualize_bulk_historicals(
         condition: Dict of format {'condition': [value1, value2, value3]}
         ticker: Company ticker symbol
         apikey: API key for financial data services
+        show: Display the plot; when False the figure is only saved and then closed
     """
+    _apply_theme()
+    condition_name = next(iter(condition))
     dcf_share_prices = {}
     try:
-        conditions = [str(cond) for cond in next(iter(condition.values()))]
+        conditions = [str(cond) for cond in condition[condition_name]]
     except IndexError:
         logger.error(f"Invalid condition format: {condition}")
         conditions = [condition["Ticker"]]
 
     for cond in conditions:
-        dcf_share_prices[cond] = {}
-        years = dcfs[cond].keys()
-        for year in years:
-            dcf_share_prices[cond][year] = dcfs[cond][year]["share_price"]
-
-    for cond in conditions:
+        dcf_share_prices[cond] = {year: dcf["share_price"] for year, dcf in dcfs[cond].items()}
         plt.plot(
-            list(dcf_share_prices[cond].keys())[::-1],
-            list(dcf_share_prices[cond].values())[::-1],
+            list(reversed(dcf_share_prices[cond].keys())),
+            list(reversed(dcf_share_prices[cond].values())),
             label=cond,
         )
 
-    # sorry for anybody reading this, bit too pythonic
-    # the second argument here just fetches the list of dates we're using as x values
-    # in the above plt.plot() call without knowing the conditions we index with above
+    # Every condition covers the same dates, so the first one supplies the x values
     historical_stock_prices = get_historical_share_prices(
         ticker=ticker,
-        dates=list(dcf_share_prices[next(iter(dcf_share_prices.keys()))].keys())[::-1],
+        dates=list(reversed(dcf_share_prices[conditions[0]].keys())),
         apikey=apikey,
     )
     plt.plot(
@@ -115,23 +134,22 @@ def visualize_bulk_historicals(
     plt.ylabel("Share price ($)")
     plt.legend(loc="upper right")
     plt.title("$" + ticker + "  ")
-    plt.savefig("imgs/{}_{}.png".format(ticker, next(iter(condition.keys()))))
-    plt.show()
+    plt.savefig("imgs/{}_{}.png".format(ticker, condition_name))
+    _show_or_close(show)
 
 
-def visualize_historicals(dcfs: Dict[str, Any]) -> None:
+def visualize_historicals(dcfs: Dict[str, Any], show: bool = True) -> None:
     """
     2d plot comparing dcf history to share price history.
 
     Args:
         dcfs: Dictionary containing DCF historical data
+        show: Display the plot; when False nothing is displayed and the figure is closed
     """
-    dcf_share_prices = {}
-    for k, v in dcfs.items():
-        dcf_share_prices[dcfs[k]["date"]] = v["share_price"]
-
-    xs = list(dcf_share_prices.keys())[::-1]
-    ys = list(dcf_share_prices.values())[::-1]
+    _apply_theme()
+    # ISO date strings sort chronologically; string dates form a categorical
+    # axis in the order plotted, so sort to run it oldest to newest
+    results = sorted(dcfs.values(), key=lambda v: v["date"])
 
-    plt.scatter(xs, ys)
-    plt.show()
+    plt.scatter([v["date"] for v in results], [v["share_price"] for v in results])
+    _show_or_close(show)
@@ -21,12 +21,18 @@ def prettyprint(dcfs: Dict[str, Any], years: int) -> None:
         dcfs: Dictionary containing DCF results
         years: Number of years in the analysis
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    # Build the whole print-out first and log it as a single record
+    lines = []
     if years > 1:
         for k, v in dcfs.items():
-            logger.info(f"ticker: {k}")
+            lines.append(f"ticker: {k}")
             if len(v.keys()) > 1:
-                for yr, dcf in v.items():
-                    logger.info(f"date: {yr} \nvalue: {dcf}")
+                lines.extend(f"date: {yr} \nvalue: {dcf}" for yr, dcf in v.items())
     else:
-        for k, v in dcfs.items():
-            logger.info(f"ticker: {k} \nvalue: {v}")
+        lines.extend(f"ticker: {k} \nvalue: {v}" for k, v in dcfs.items())
+
+    if lines:
+        logger.info("\n".join(lines))
@@ -0,0 +1,18 @@
+"""
+Shared pytest fixtures.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from app.modeling import data
+from app.services.cache_service import CacheService
+
+
+@pytest.fixture
+def cache_service(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> CacheService:
+    """CacheService in a temporary directory, used by every fetcher created in the test."""
+    service = CacheService(str(tmp_path))
+    monkeypatch.setattr(data, "get_cache_service", lambda: service)
+    return service
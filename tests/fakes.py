@@ -0,0 +1,90 @@
+"""
+Fakes shared by the financial data fetcher tests.
+
+HTTP traffic goes through a fake ``requests.Session`` and cache files through a
+``CacheService`` in a temporary directory, so no network or shared cache is used.
+"""
+
+import json
+import time
+from typing import Dict, List, Optional
+
+import requests
+
+from app.modeling import data
+from app.services.cache_service import CacheService
+
+TICKER = "AAPL"
+ENTERPRISE_VALUE = "enterprise-value"
+ENTERPRISE_VALUE_ROWS = [
+    {
+        "date": "2024-09-28",
+        "addTotalDebt": 1.0e11,
+        "minusCashAndCashEquivalents": 5.0e10,
+        "numberOfShares": 1.5e10,
+    }
+]
+
+
+def make_response(
+    status_code: int = 200, body: object = None, headers: Optional[Dict[str, str]] = None
+) -> requests.Response:
+    """Build a response the fetcher can read without a network connection."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = "Not Modified" if status_code == 304 else "OK"
+    response.url = "https://example.test/"
+    response.headers.update(headers or {})
+    response._content = b"" if body is None else json.dumps(body).encode()
+    response._content_consumed = True
+    return response
+
+
+class FakeSession(requests.Session):
+    """Session answering GETs with queued responses and recording the requests."""
+
+    def __init__(self, *responses: requests.Response) -> None:
+        super().__init__()
+        self.responses = list(responses)
+        self.requests: List[tuple[str, Dict[str, str]]] = []
+
+    def get(self, url: str, **kwargs: object) -> requests.Response:  # type: ignore[override]
+        self.requests.append((url, dict(kwargs.get("headers") or {})))
+        return self.responses.pop(0)
+
+
+def make_fetcher(session: FakeSession) -> data.FinancialDataFetcher:
+    return data.FinancialDataFetcher(api_key="test", session=session)
+
+
+def write_entry(
+    cache_service: CacheService,
+    data_type: str,
+    payload: object,
+    fetched_at: float,
+    ttl_seconds: float,
+    **validators: str,
+) -> None:
+    """Write a cache file for ``payload`` as if it had been fetched at ``fetched_at``."""
+    entry = {
+        "ticker": TICKER,
+        "data_type": data_type,
+        "period": "annual",
+        "cached_at": "2000-01-01T00:00:00",
+        "fetched_at": fetched_at,
+        "ttl_seconds": ttl_seconds,
+        **validators,
+        "data": payload,
+    }
+    path = cache_service.get_cache_path(cache_service.get_cache_key(TICKER, data_type))
+    path.write_text(json.dumps(entry))
+
+
+def write_expired_entry(
+    cache_service: CacheService, data_type: str, payload: object, **validators: str
+) -> float:
+    """Cache ``payload`` as an entry past its TTL and return its fetch time."""
+    ttl_seconds = cache_service.get_ttl_seconds(data_type)
+    fetched_at = time.time() - 2 * ttl_seconds
+    write_entry(cache_service, data_type, payload, fetched_at, ttl_seconds, **validators)
+    return fetched_at
@@ -0,0 +1,98 @@
+"""
+Tests for command line parsing.
+"""
+
+import dataclasses
+import logging
+
+import pytest
+
+from app import argument_parser
+from app.argument_parser import (
+    ANALYZE_COMMAND,
+    CACHE_INFO_COMMAND,
+    CLEAR_CACHE_COMMAND,
+    create_argument_parser,
+    show_cache_info,
+)
+from app.services.cache_service import CacheService
+
+
+def test_arguments_without_a_command_run_an_analysis() -> None:
+    args = create_argument_parser(["--ticker", "MSFT", "--years", "2"])
+
+    assert args.command == ANALYZE_COMMAND
+    assert args.ticker == "MSFT"
+    assert args.years == 2
+
+
+def test_no_arguments_run_an_analysis_with_defaults() -> None:
+    args = create_argument_parser([])
+
+    assert args.command == ANALYZE_COMMAND
+    assert args.ticker == "AAPL"
+
+
+@pytest.mark.parametrize("command", [CACHE_INFO_COMMAND, CLEAR_CACHE_COMMAND])
+def test_cache_commands_take_no_analysis_options(command: str) -> None:
+    args = create_argument_parser([command])
+
+    assert args.command == command
+    assert not hasattr(args, "ticker")
+
+
+def test_help_lists_analysis_options_and_cache_commands(capsys: pytest.CaptureFixture) -> None:
+    with pytest.raises(SystemExit) as exit_info:
+        create_argument_parser(["--help"])
+
+    assert exit_info.value.code == 0
+    help_text = capsys.readouterr().out
+    assert "--ticker" in help_text
+    assert "--discount_rate" in help_text
+    assert CACHE_INFO_COMMAND in help_text
+    assert CLEAR_CACHE_COMMAND in help_text
+
+
+@pytest.mark.parametrize(
+    ("argv", "usage"),
+    [(["--bogus"], "analyze"), ([CACHE_INFO_COMMAND, "--bogus"], CACHE_INFO_COMMAND)],
+)
+def test_unknown_arguments_report_the_command_usage(
+    argv: list, usage: str, capsys: pytest.CaptureFixture
+) -> None:
+    with pytest.raises(SystemExit) as exit_info:
+        create_argument_parser(argv)
+
+    assert exit_info.value.code == 2
+    error = capsys.readouterr().err
+    assert f" {usage} [-h]" in error
+    assert "unrecognized arguments: --bogus" in error
+
+
+def test_api_key_falls_back_to_config_for_analyses(monkeypatch: pytest.MonkeyPatch) -> None:
+    config = argument_parser.config
+    monkeypatch.setattr(
+        argument_parser,
+        "config",
+        dataclasses.replace(config, api=dataclasses.replace(config.api, api_key="from-env")),
+    )
+
+    assert create_argument_parser([]).apikey == "from-env"
+    assert create_argument_parser(["--apikey", "given"]).apikey == "given"
+    assert not hasattr(create_argument_parser([CACHE_INFO_COMMAND]), "apikey")
+
+
+def test_cache_info_warns_about_corrupted_files(
+    cache_service: CacheService,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    monkeypatch.setattr("app.services.cache_service.get_cache_service", lambda: cache_service)
+    cache_service.save_data("AAPL", "enterprise-value", [{"date": "2024-09-28"}])
+    (cache_service.cache_directory / "broken.json").write_text("{not json")
+
+    with caplog.at_level(logging.WARNING, logger=argument_parser.logger.name):
+        show_cache_info()
+
+    assert [record.levelno for record in caplog.records] == [logging.WARNING]
+    assert "broken.json: Corrupted cache file" in caplog.text
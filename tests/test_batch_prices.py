@@ -0,0 +1,39 @@
+"""
+Tests for fetching real-time prices through the comma-joined batch endpoint.
+"""
+
+from app.modeling import data
+from app.services.cache_service import CacheService
+from tests.fakes import FakeSession, make_fetcher, make_response
+
+
+def test_batch_request_covers_uncached_tickers_and_retries_the_rest(
+    cache_service: CacheService,
+) -> None:
+    cache_service.save_data("MSFT", data.REAL_TIME_PRICE, {"symbol": "MSFT", "price": 415.0})
+    session = FakeSession(
+        make_response(200, {"companiesPriceList": [{"symbol": "AAPL", "price": 227.5}]}),
+        make_response(200, {"symbol": "GOOG", "price": 165.25}),
+    )
+
+    fetcher = make_fetcher(session)
+    prices = fetcher.get_batch_stock_prices(["AAPL", "MSFT", "GOOG", "AAPL"])
+    fetcher.close()
+
+    assert prices == {"AAPL": 227.5, "MSFT": 415.0, "GOOG": 165.25}
+    assert "/AAPL,GOOG?" in session.requests[0][0]
+    assert "/GOOG?" in session.requests[1][0]
+    assert len(session.requests) == 2
+    assert cache_service.load_data("AAPL", data.REAL_TIME_PRICE)["price"] == 227.5
+
+
+def test_invalid_cached_quote_is_refetched(cache_service: CacheService) -> None:
+    cache_service.save_data("AAPL", data.REAL_TIME_PRICE, {"symbol": "AAPL", "price": 0})
+    session = FakeSession(make_response(200, {"symbol": "AAPL", "price": 227.5}))
+
+    fetcher = make_fetcher(session)
+    prices = fetcher.get_batch_stock_prices(["AAPL"])
+    fetcher.close()
+
+    assert prices == {"AAPL": 227.5}
+    assert len(session.requests) == 1
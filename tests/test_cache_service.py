@@ -0,0 +1,60 @@
+"""
+Tests for per-data-type cache expiry in CacheService.
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from app.services.cache_service import CACHE_TTL_SECONDS, SECONDS_PER_DAY, CacheService
+from tests.fakes import ENTERPRISE_VALUE_ROWS, TICKER, write_entry
+
+
+def test_statements_outlive_quotes() -> None:
+    assert CACHE_TTL_SECONDS["financials/income-statement"] >= 90 * SECONDS_PER_DAY
+    assert CACHE_TTL_SECONDS["stock/real-time-price"] <= 60 * 60
+    assert CACHE_TTL_SECONDS["historical-price-full"] < CACHE_TTL_SECONDS["enterprise-value"]
+
+
+def test_unknown_data_type_uses_default_expiration(cache_service: CacheService) -> None:
+    assert cache_service.get_ttl_seconds("unknown") == cache_service.default_expiration_hours * 3600
+
+
+def test_saved_entry_records_its_type_ttl(cache_service: CacheService) -> None:
+    cache_service.save_data(TICKER, "stock/real-time-price", {"price": 1.0})
+
+    entry = cache_service.load_entry(TICKER, "stock/real-time-price")
+    assert entry["ttl_seconds"] == CACHE_TTL_SECONDS["stock/real-time-price"]
+    assert entry["fetched_at"] == pytest.approx(time.time(), abs=5)
+
+
+@pytest.mark.parametrize(("age", "fresh"), [(50, True), (70, False)])
+def test_entry_expires_after_its_ttl(cache_service: CacheService, age: float, fresh: bool) -> None:
+    write_entry(cache_service, "stock/real-time-price", {"price": 1.0}, time.time() - age, 60)
+
+    loaded = cache_service.load_data_with_expiry(TICKER, "stock/real-time-price")
+
+    assert (loaded is not None) is fresh
+    if fresh:
+        assert loaded[1] == pytest.approx(time.time() - age + 60, abs=1)
+
+
+def test_explicit_expiration_overrides_the_ttl(cache_service: CacheService) -> None:
+    write_entry(cache_service, "stock/real-time-price", {"price": 1.0}, time.time() - 120, 60)
+
+    assert cache_service.load_data(TICKER, "stock/real-time-price") is None
+    assert cache_service.load_data(TICKER, "stock/real-time-price", expiration_hours=1) == {
+        "price": 1.0
+    }
+
+
+def test_entry_without_ttl_falls_back_to_file_time(cache_service: CacheService) -> None:
+    path = cache_service.get_cache_path(cache_service.get_cache_key(TICKER, "enterprise-value"))
+    path.write_text(json.dumps({"data_type": "enterprise-value", "data": ENTERPRISE_VALUE_ROWS}))
+    assert cache_service.load_data(TICKER, "enterprise-value") == ENTERPRISE_VALUE_ROWS
+
+    stale = time.time() - 2 * CACHE_TTL_SECONDS["enterprise-value"]
+    os.utime(path, (stale, stale))
+    assert cache_service.load_data(TICKER, "enterprise-value") is None
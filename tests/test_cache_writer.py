@@ -0,0 +1,60 @@
+"""
+Tests for writing cache files behind the fetch path.
+"""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from app.exceptions import ConfigurationError
+from app.services.cache_service import CacheService
+from tests.fakes import (
+    ENTERPRISE_VALUE,
+    ENTERPRISE_VALUE_ROWS,
+    TICKER,
+    FakeSession,
+    make_fetcher,
+    make_response,
+)
+
+
+def test_close_flushes_pending_cache_writes(
+    cache_service: CacheService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    started = threading.Event()
+    save_data = cache_service.save_data
+
+    def slow_save_data(*args: object) -> None:
+        started.set()
+        time.sleep(0.2)
+        save_data(*args)
+
+    monkeypatch.setattr(cache_service, "save_data", slow_save_data)
+    fetcher = make_fetcher(FakeSession(make_response(200, ENTERPRISE_VALUE_ROWS)))
+    fetcher.get_enterprise_value_statement(TICKER)
+
+    assert started.wait(timeout=5)
+    assert cache_service.load_data(TICKER, ENTERPRISE_VALUE) is None
+    fetcher.close()
+    assert cache_service.load_data(TICKER, ENTERPRISE_VALUE) == ENTERPRISE_VALUE_ROWS
+
+
+def test_failed_cache_write_is_logged_not_raised(
+    cache_service: CacheService,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    def failing_save_data(*_args: object) -> None:
+        raise ConfigurationError("disk full")
+
+    monkeypatch.setattr(cache_service, "save_data", failing_save_data)
+    fetcher = make_fetcher(FakeSession(make_response(200, ENTERPRISE_VALUE_ROWS)))
+
+    with caplog.at_level(logging.WARNING):
+        result = fetcher.get_enterprise_value_statement(TICKER)
+        fetcher.close()
+
+    assert result["data"] == ENTERPRISE_VALUE_ROWS
+    assert "disk full" in caplog.text
@@ -0,0 +1,75 @@
+"""
+Tests for revalidating expired cache entries with conditional requests.
+"""
+
+from app.services.cache_service import CacheService
+from tests.fakes import (
+    ENTERPRISE_VALUE,
+    ENTERPRISE_VALUE_ROWS,
+    TICKER,
+    FakeSession,
+    make_fetcher,
+    make_response,
+    write_expired_entry,
+)
+
+
+def test_not_modified_reuses_stale_entry_and_refreshes_ttl(cache_service: CacheService) -> None:
+    fetched_at = write_expired_entry(
+        cache_service, ENTERPRISE_VALUE, ENTERPRISE_VALUE_ROWS, etag='"v1"'
+    )
+    session = FakeSession(make_response(304))
+
+    fetcher = make_fetcher(session)
+    result = fetcher.get_enterprise_value_statement(TICKER)
+    fetcher.close()
+
+    assert result["data"] == ENTERPRISE_VALUE_ROWS
+    assert session.requests[0][1]["If-None-Match"] == '"v1"'
+    entry = cache_service.load_entry(TICKER, ENTERPRISE_VALUE)
+    assert entry["fetched_at"] > fetched_at
+    assert entry["etag"] == '"v1"'
+    assert cache_service.load_data(TICKER, ENTERPRISE_VALUE) == ENTERPRISE_VALUE_ROWS
+
+
+def test_response_validators_are_stored_and_sent_on_revalidation(
+    cache_service: CacheService,
+) -> None:
+    validators = {"ETag": '"v2"', "Last-Modified": "Wed, 02 Oct 2024 00:00:00 GMT"}
+    fetcher = make_fetcher(FakeSession(make_response(200, ENTERPRISE_VALUE_ROWS, validators)))
+    fetcher.get_enterprise_value_statement(TICKER)
+    fetcher.close()
+
+    entry = cache_service.load_entry(TICKER, ENTERPRISE_VALUE)
+    assert entry["etag"] == '"v2"'
+    assert entry["last_modified"] == validators["Last-Modified"]
+
+    write_expired_entry(
+        cache_service,
+        ENTERPRISE_VALUE,
+        ENTERPRISE_VALUE_ROWS,
+        etag=entry["etag"],
+        last_modified=entry["last_modified"],
+    )
+    session = FakeSession(make_response(304))
+    fetcher = make_fetcher(session)
+    fetcher.get_enterprise_value_statement(TICKER)
+    fetcher.close()
+
+    headers = session.requests[0][1]
+    assert headers["If-None-Match"] == '"v2"'
+    assert headers["If-Modified-Since"] == validators["Last-Modified"]
+
+
+def test_fresh_entry_is_served_without_a_request(cache_service: CacheService) -> None:
+    cache_service.save_data(
+        TICKER, ENTERPRISE_VALUE, ENTERPRISE_VALUE_ROWS, validators={"etag": "x"}
+    )
+    session = FakeSession()
+
+    fetcher = make_fetcher(session)
+    result = fetcher.get_enterprise_value_statement(TICKER)
+    fetcher.close()
+
+    assert result["data"] == ENTERPRISE_VALUE_ROWS
+    assert not session.requests
@@ -0,0 +1,227 @@
+"""
+Tests for the DCF math, checked against a plain loop over the forecast years.
+"""
+
+import dataclasses
+import logging
+import math
+from typing import Dict, List
+
+import numpy as np
+import pytest
+
+from app.custom_types import DCFParameters, SensitivityVariable
+from app.exceptions import DCFCalculationError
+from app.modeling.data import to_statement_frame
+from app.services.dcf_service import DCFService, Statements, _geometric_series_sum
+
+TICKER = "AAPL"
+TAX_RATE = 0.25
+DATES = ["2024-09-28", "2023-09-30", "2022-09-24"]
+EBIT = [1.23e11, 1.14e11, 1.19e11]
+DEPRECIATION = [1.14e10, 1.15e10, 1.11e10]
+CAP_EX = [-9.4e9, -1.1e10, -1.07e10]
+CURRENT_ASSETS = [1.53e11, 1.43e11, 1.35e11]
+CURRENT_LIABILITIES = [1.76e11, 1.45e11, 1.54e11]
+TOTAL_DEBT = [1.06e11, 1.11e11, 1.2e11]
+CASH = [2.99e10, 2.97e10, 2.36e10]
+SHARES = [1.52e10, 1.56e10, 1.6e10]
+
+
+def make_statement(**columns: List[float]) -> Dict:
+    rows = [
+        {"date": date, **{field: values[i] for field, values in columns.items()}}
+        for i, date in enumerate(DATES)
+    ]
+    return {"ticker": TICKER, "period": "annual", "data": rows}
+
+
+def make_statements() -> Statements:
+    return (
+        to_statement_frame(
+            make_statement(
+                addTotalDebt=TOTAL_DEBT, minusCashAndCashEquivalents=CASH, numberOfShares=SHARES
+            )
+        ),
+        to_statement_frame(make_statement(EBIT=EBIT)),
+        to_statement_frame(
+            make_statement(
+                **{
+                    "Total current assets": CURRENT_ASSETS,
+                    "Total current liabilities": CURRENT_LIABILITIES,
+                }
+            )
+        ),
+        to_statement_frame(
+            make_statement(
+                **{"Depreciation & Amortization": DEPRECIATION, "Capital Expenditure": CAP_EX}
+            )
+        ),
+    )
+
+
+@pytest.fixture
+def service() -> DCFService:
+    dcf_service = DCFService(api_key="test", caching=False)
+    dcf_service._statements[(TICKER, "annual")] = make_statements()
+    return dcf_service
+
+
+def reference_enterprise_value(
+    index: int,
+    forecast_years: int,
+    discount_rate: float,
+    earnings_growth_rate: float,
+    cap_ex_growth_rate: float,
+    perpetual_growth_rate: float,
+) -> float:
+    """Enterprise value as the original implementation computed it, year by year."""
+    cwc = 0.0
+    if index + 1 < len(DATES):
+        cwc = (CURRENT_ASSETS[index] - CURRENT_LIABILITIES[index]) - (
+            CURRENT_ASSETS[index + 1] - CURRENT_LIABILITIES[index + 1]
+        )
+    cap_ex = abs(CAP_EX[index])
+    current_fcf = EBIT[index] * (1 - TAX_RATE) + DEPRECIATION[index] + cwc + cap_ex
+
+    pv_explicit = 0.0
+    for year in range(1, forecast_years + 1):
+        future_fcf = current_fcf * (1 + earnings_growth_rate) ** year
+        future_fcf -= cap_ex * (1 + cap_ex_growth_rate) ** year
+        pv_explicit += future_fcf / (1 + discount_rate) ** year
+
+    terminal_fcf = current_fcf * (1 + earnings_growth_rate) ** forecast_years
+    terminal_value = (
+        terminal_fcf * (1 + perpetual_growth_rate) / (discount_rate - perpetual_growth_rate)
+    )
+    return pv_explicit + terminal_value / (1 + discount_rate) ** forecast_years
+
+
+def reference_share_price(index: int, *rates: float) -> float:
+    enterprise_value = reference_enterprise_value(index, *rates)
+    return (enterprise_value - TOTAL_DEBT[index] + CASH[index]) / SHARES[index]
+
+
+@pytest.mark.parametrize("ratio", [0.5, 0.97, 1.0, 1.0 + 1e-13, 1.08])
+@pytest.mark.parametrize("terms", [1, 5, 10])
+def test_geometric_series_sum_matches_loop(ratio: float, terms: int) -> None:
+    expected = sum(ratio**k for k in range(1, terms + 1))
+
+    assert _geometric_series_sum(ratio, terms) == pytest.approx(expected, rel=1e-12)
+
+
+def test_geometric_series_sum_handles_arrays_with_a_unit_ratio() -> None:
+    ratios = np.array([0.9, 1.0, 1.1])
+
+    total = _geometric_series_sum(ratios, 5)
+
+    expected = [sum(r**k for k in range(1, 6)) for r in ratios.tolist()]
+    np.testing.assert_allclose(total, expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "rates",
+    [
+        # forecast_years, discount, earnings growth, cap_ex growth, perpetual growth
+        (5, 0.10, 0.05, 0.03, 0.02),
+        (5, 0.10, 0.10, 0.03, 0.02),  # earnings grow at the discount rate
+        (5, 0.10, 0.05, 0.10, 0.02),  # capital expenditure grows at the discount rate
+        (10, 0.08, 0.15, -0.02, 0.03),
+        (1, 0.12, 0.0, 0.0, 0.0),
+    ],
+)
+@pytest.mark.parametrize("index", [0, 2])
+def test_enterprise_value_matches_reference_loop(
+    service: DCFService, rates: tuple, index: int
+) -> None:
+    _, income, balance, cashflow = make_statements()
+
+    enterprise_value = service._calculate_enterprise_value(income, cashflow, balance, *rates, index)
+
+    assert enterprise_value == pytest.approx(reference_enterprise_value(index, *rates), rel=1e-12)
+    assert math.isfinite(enterprise_value)
+
+
+BASE_PARAMS = DCFParameters(
+    ticker=TICKER,
+    years=3,
+    forecast_years=5,
+    discount_rate=0.10,
+    earnings_growth_rate=0.05,
+    cap_ex_growth_rate=0.03,
+    perpetual_growth_rate=0.02,
+    interval="annual",
+)
+
+
+@pytest.mark.parametrize(
+    ("variable", "values"),
+    [
+        # Step 0.025 from 0.05 reaches the 0.10 discount rate on the third step
+        (SensitivityVariable.EARNINGS_GROWTH_RATE, np.arange(4) * 0.025 + 0.05),
+        (SensitivityVariable.CAP_EX_GROWTH_RATE, np.arange(5) * 0.035 + 0.03),
+        (SensitivityVariable.DISCOUNT_RATE, np.arange(4) * 0.01 + 0.07),
+        (SensitivityVariable.PERPETUAL_GROWTH_RATE, np.arange(3) * 0.01 + 0.01),
+    ],
+)
+def test_sweep_matches_reference_loop_for_every_step(
+    service: DCFService, variable: SensitivityVariable, values: np.ndarray
+) -> None:
+    results = service.calculate_historical_dcf_sweep(BASE_PARAMS, variable, values)
+
+    assert len(results) == len(values)
+    for step_dcfs, value in zip(results, values.tolist()):
+        rates = {
+            "forecast_years": BASE_PARAMS.forecast_years,
+            "discount_rate": BASE_PARAMS.discount_rate,
+            "earnings_growth_rate": BASE_PARAMS.earnings_growth_rate,
+            "cap_ex_growth_rate": BASE_PARAMS.cap_ex_growth_rate,
+            "perpetual_growth_rate": BASE_PARAMS.perpetual_growth_rate,
+            variable.value: value,
+        }
+        assert list(step_dcfs) == DATES
+        for index, date in enumerate(DATES):
+            expected = reference_share_price(index, *rates.values())
+            assert step_dcfs[date].share_price == pytest.approx(expected, rel=1e-12)
+            assert isinstance(step_dcfs[date].share_price, float)
+
+
+def test_sweep_matches_single_historical_dcfs(service: DCFService) -> None:
+    values = np.array([0.08, 0.09, 0.10])
+
+    results = service.calculate_historical_dcf_sweep(
+        BASE_PARAMS, SensitivityVariable.DISCOUNT_RATE, values
+    )
+
+    for step_dcfs, value in zip(results, values.tolist()):
+        params = dataclasses.replace(BASE_PARAMS, discount_rate=value)
+        single = service.calculate_historical_dcf(params)
+        assert list(step_dcfs) == list(single)
+        for date, result in single.items():
+            assert step_dcfs[date].enterprise_value == pytest.approx(result.enterprise_value)
+            assert step_dcfs[date].share_price == pytest.approx(result.share_price)
+
+
+def test_requested_intervals_are_capped_at_the_periods_available(
+    service: DCFService, caplog: pytest.LogCaptureFixture
+) -> None:
+    params = dataclasses.replace(BASE_PARAMS, years=5)
+
+    with caplog.at_level(logging.WARNING):
+        dcfs = service.calculate_historical_dcf(params)
+
+    assert list(dcfs) == DATES
+    assert "Only 3 annual periods available" in caplog.text
+
+
+def test_no_periods_available_raises(service: DCFService) -> None:
+    empty = to_statement_frame({"ticker": TICKER, "period": "annual", "data": []})
+    ev_statement, _, balance, cashflow = make_statements()
+    service._statements[(TICKER, "annual")] = (ev_statement, empty, balance, cashflow)
+
+    with pytest.raises(DCFCalculationError, match="No annual statement periods"):
+        service.calculate_historical_dcf(BASE_PARAMS)
+    with pytest.raises(DCFCalculationError, match="No annual statement periods"):
+        service.calculate_historical_dcf_sweep(
+            BASE_PARAMS, SensitivityVariable.DISCOUNT_RATE, np.array([0.08, 0.09])
+        )
@@ -0,0 +1,59 @@
+"""
+Tests for fetching historical share prices with one ranged request.
+"""
+
+import pytest
+
+from app.modeling import data
+from app.services.cache_service import CacheService
+from tests.fakes import TICKER, FakeSession, make_fetcher, make_response
+
+
+def test_range_response_is_split_into_per_date_closes(cache_service: CacheService) -> None:
+    historical = [
+        {"date": "2024-06-27", "close": 214.10},
+        {"date": "2024-06-28", "close": 210.62},
+        {"date": "2024-07-15", "close": 234.40},
+        {"date": "2024-09-26", "close": 227.52},
+        {"date": "2024-09-27", "close": 227.79},
+    ]
+    session = FakeSession(make_response(200, {"symbol": TICKER, "historical": historical}))
+
+    fetcher = make_fetcher(session)
+    # 2024-09-28 is a Saturday, so its close is the previous trading day's
+    prices = fetcher.get_historical_share_prices(TICKER, ["2024-09-28", "2024-06-28"])
+    fetcher.close()
+
+    assert prices == {"2024-09-28": 227.79, "2024-06-28": 210.62}
+    assert len(session.requests) == 1
+    assert "from=2024-06-26&to=2024-09-28" in session.requests[0][0]
+
+    cached = cache_service.load_data(TICKER, data.HISTORICAL_PRICE, "2024-09-28")
+    assert [row["date"] for row in cached["historical"]] == ["2024-09-27", "2024-09-26"]
+    cached = cache_service.load_data(TICKER, data.HISTORICAL_PRICE, "2024-06-28")
+    assert [row["date"] for row in cached["historical"]] == ["2024-06-28", "2024-06-27"]
+
+
+@pytest.mark.usefixtures("cache_service")
+def test_only_uncached_dates_are_requested() -> None:
+    first = FakeSession(
+        make_response(
+            200, {"symbol": TICKER, "historical": [{"date": "2024-09-27", "close": 227.79}]}
+        )
+    )
+    fetcher = make_fetcher(first)
+    fetcher.get_historical_share_prices(TICKER, ["2024-09-27"])
+    fetcher.close()
+
+    second = FakeSession(
+        make_response(
+            200, {"symbol": TICKER, "historical": [{"date": "2023-09-29", "close": 171.21}]}
+        )
+    )
+    fetcher = make_fetcher(second)
+    prices = fetcher.get_historical_share_prices(TICKER, ["2024-09-27", "2023-09-29"])
+    fetcher.close()
+
+    assert prices == {"2024-09-27": 227.79, "2023-09-29": 171.21}
+    assert len(second.requests) == 1
+    assert "from=2023-09-27&to=2023-09-29" in second.requests[0][0]
@@ -0,0 +1,50 @@
+"""
+Tests for the fetchers shared by the legacy module-level helpers.
+"""
+
+import dataclasses
+import functools
+
+import pytest
+
+from app.modeling import data
+from app.services.cache_service import CacheService
+from tests.fakes import ENTERPRISE_VALUE, ENTERPRISE_VALUE_ROWS, TICKER, FakeSession, make_response
+
+
+@pytest.fixture
+def session(monkeypatch: pytest.MonkeyPatch) -> FakeSession:
+    fake_session = FakeSession()
+    monkeypatch.setattr(data, "_legacy_fetchers", {})
+    monkeypatch.setattr(
+        data, "_get_shared_session", functools.lru_cache(maxsize=1)(lambda: fake_session)
+    )
+    return fake_session
+
+
+@pytest.mark.usefixtures("cache_service", "session")
+def test_empty_key_shares_the_configured_key_fetcher(monkeypatch: pytest.MonkeyPatch) -> None:
+    config = data.config
+    monkeypatch.setattr(
+        data,
+        "config",
+        dataclasses.replace(config, api=dataclasses.replace(config.api, api_key="configured")),
+    )
+
+    fetcher = data._fetcher_for("")
+
+    assert fetcher is data._fetcher_for("configured")
+    assert fetcher.api_key == "configured"
+    data._close_legacy_fetchers()
+
+
+def test_closing_at_exit_flushes_queued_cache_writes(
+    session: FakeSession, cache_service: CacheService
+) -> None:
+    session.responses.append(make_response(200, ENTERPRISE_VALUE_ROWS))
+
+    assert data.get_ev_statement(TICKER, apikey="key") == ENTERPRISE_VALUE_ROWS
+    data._close_legacy_fetchers()
+
+    assert not data._legacy_fetchers
+    assert cache_service.load_data(TICKER, ENTERPRISE_VALUE) == ENTERPRISE_VALUE_ROWS
@@ -0,0 +1,71 @@
+"""
+Tests for the fetcher's in-memory copy of cache hits.
+"""
+
+import time
+
+import pytest
+
+from app.modeling import data
+from app.services.cache_service import CacheService
+from tests.fakes import (
+    ENTERPRISE_VALUE,
+    ENTERPRISE_VALUE_ROWS,
+    TICKER,
+    FakeSession,
+    make_fetcher,
+    make_response,
+    write_entry,
+)
+
+
+def test_memory_cache_expires_with_the_disk_entry(cache_service: CacheService) -> None:
+    # Written almost a full TTL ago, so only a fraction of a second remains
+    write_entry(cache_service, ENTERPRISE_VALUE, ENTERPRISE_VALUE_ROWS, time.time() - 0.7, 1.0)
+    session = FakeSession(make_response(200, ENTERPRISE_VALUE_ROWS))
+
+    fetcher = make_fetcher(session)
+    assert fetcher.get_enterprise_value_statement(TICKER)["data"] == ENTERPRISE_VALUE_ROWS
+    assert not session.requests
+
+    time.sleep(0.5)
+    assert fetcher.get_enterprise_value_statement(TICKER)["data"] == ENTERPRISE_VALUE_ROWS
+    fetcher.close()
+    assert len(session.requests) == 1
+
+
+def test_cached_data_is_copied_for_each_caller(cache_service: CacheService) -> None:
+    write_entry(
+        cache_service,
+        ENTERPRISE_VALUE,
+        ENTERPRISE_VALUE_ROWS,
+        time.time(),
+        cache_service.get_ttl_seconds(ENTERPRISE_VALUE),
+    )
+
+    fetcher = make_fetcher(FakeSession())
+    first = fetcher.get_enterprise_value_statement(TICKER)["data"]
+    first[0]["numberOfShares"] = 999
+    first.append("junk")
+
+    assert fetcher.get_enterprise_value_statement(TICKER)["data"] == ENTERPRISE_VALUE_ROWS
+    fetcher.close()
+    assert cache_service.load_data(TICKER, ENTERPRISE_VALUE) == ENTERPRISE_VALUE_ROWS
+
+
+def test_least_recently_used_entries_are_evicted(
+    cache_service: CacheService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(data, "MEMORY_CACHE_MAXSIZE", 2)
+    ttl_seconds = cache_service.get_ttl_seconds(ENTERPRISE_VALUE)
+    fetcher = make_fetcher(FakeSession())
+    for period in ("annual", "quarter", "annual", "2024-09-28"):
+        fetcher._remember((TICKER, ENTERPRISE_VALUE, period), ENTERPRISE_VALUE_ROWS)
+    fetcher.close()
+
+    assert list(fetcher._memory_cache) == [
+        (TICKER, ENTERPRISE_VALUE, "annual"),
+        (TICKER, ENTERPRISE_VALUE, "2024-09-28"),
+    ]
+    expires_at, _ = fetcher._memory_cache[(TICKER, ENTERPRISE_VALUE, "annual")]
+    assert expires_at - time.monotonic() <= min(ttl_seconds, data.MEMORY_CACHE_TTL_SECONDS)
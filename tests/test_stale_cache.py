@@ -0,0 +1,49 @@
+"""
+Tests for serving expired cache entries when the API fails.
+"""
+
+import pytest
+import requests
+
+from app.exceptions import DataFetchError
+from app.services.cache_service import CacheService
+from tests.fakes import (
+    ENTERPRISE_VALUE,
+    ENTERPRISE_VALUE_ROWS,
+    TICKER,
+    FakeSession,
+    make_fetcher,
+    make_response,
+    write_expired_entry,
+)
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        make_response(200, {"Error Message": "Limit Reach"}),
+        make_response(500, {"message": "Internal Server Error"}),
+    ],
+    ids=["api-error", "http-error"],
+)
+def test_api_failure_serves_expired_entry(
+    cache_service: CacheService, response: requests.Response
+) -> None:
+    fetched_at = write_expired_entry(cache_service, ENTERPRISE_VALUE, ENTERPRISE_VALUE_ROWS)
+
+    fetcher = make_fetcher(FakeSession(response))
+    result = fetcher.get_enterprise_value_statement(TICKER)
+    fetcher.close()
+
+    assert result["data"] == ENTERPRISE_VALUE_ROWS
+    # The expired entry isn't refreshed, so the next call tries the API again
+    assert cache_service.load_entry(TICKER, ENTERPRISE_VALUE)["fetched_at"] == fetched_at
+    assert cache_service.load_data(TICKER, ENTERPRISE_VALUE) is None
+
+
+@pytest.mark.usefixtures("cache_service")
+def test_api_failure_without_cached_entry_raises() -> None:
+    fetcher = make_fetcher(FakeSession(make_response(500, {"message": "down"})))
+    with pytest.raises(DataFetchError):
+        fetcher.get_enterprise_value_statement(TICKER)
+    fetcher.close()
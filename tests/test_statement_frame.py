@@ -0,0 +1,54 @@
+"""
+Tests for reading statement values through StatementFrame.
+"""
+
+import logging
+
+import pytest
+
+from app.custom_types import StatementFrame
+from app.exceptions import DCFCalculationError
+from app.modeling.data import to_statement_frame
+
+
+def make_frame(*rows: dict) -> StatementFrame:
+    return to_statement_frame({"ticker": "AAPL", "period": "annual", "data": list(rows)})
+
+
+def test_value_reads_numeric_and_numeric_string_fields() -> None:
+    frame = make_frame(
+        {"date": "2024-09-28", "EBIT": "123.5", "numberOfShares": 10},
+        {"date": "2023-09-30", "EBIT": 100.0, "numberOfShares": 11},
+    )
+
+    assert frame.value("EBIT") == 123.5
+    assert frame.value("EBIT", 1) == 100.0
+    assert frame.value("numberOfShares", 1) == 11.0
+
+
+def test_missing_required_field_raises() -> None:
+    frame = make_frame({"date": "2024-09-28", "EBIT": 1.0})
+
+    with pytest.raises(DCFCalculationError, match="numberOfShares.*missing"):
+        frame.value("numberOfShares")
+
+
+@pytest.mark.parametrize("bad", [None, "n/a"])
+def test_unparseable_required_field_raises(bad: object) -> None:
+    frame = make_frame({"date": "2024-09-28", "EBIT": bad})
+
+    with pytest.raises(DCFCalculationError, match="EBIT.*2024-09-28"):
+        frame.value("EBIT")
+
+
+def test_optional_field_defaults_and_warns_when_unparseable(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    frame = make_frame({"date": "2024-09-28", "addTotalDebt": "n/a"})
+
+    assert frame.value("minusCashAndCashEquivalents", default=0.0) == 0.0
+    assert not caplog.records
+
+    with caplog.at_level(logging.WARNING):
+        assert frame.value("addTotalDebt", default=0.0) == 0.0
+    assert "addTotalDebt" in caplog.text